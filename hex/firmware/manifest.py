@@ -0,0 +1,24 @@
+# MicroPython frozen-module manifest for the ESP32 controller.
+#
+# Freezing compiles the controller and drivers to bytecode in flash, so
+# nothing is parsed at boot and the code no longer occupies heap.
+#
+# Build (from micropython/ports/esp32):
+#   make BOARD=ESP32_GENERIC BOARD_VARIANT=SPIRAM \
+#       FROZEN_MANIFEST=/path/to/hex/firmware/manifest.py
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+# Paths are relative to this manifest
+_SRC = "../src"
+
+# Controller and drivers (MicroPython only)
+module("esp32_main.py", base_path=_SRC, opt=3)
+module("pca9685.py", base_path=_SRC, opt=3)
+module("mpu6050.py", base_path=_SRC, opt=3)
+module("vl53l0x.py", base_path=_SRC, opt=3)
+module("ina219.py", base_path=_SRC, opt=3)
+
+# Kinematics and gaits (shared with CPython on the Pi Zero)
+module("hexapod.py", base_path=_SRC, opt=3)
+module("gait.py", base_path=_SRC, opt=3)
@@ -13,6 +13,7 @@ Pin Mapping (ESP32 WROOM-32):
     I2C:    GPIO21 (SDA), GPIO22 (SCL)
     UART2:  GPIO16 (RX), GPIO17 (TX) - to Pi Zero
     XSHUT:  GPIO25, GPIO26, GPIO27 - VL53L0X control
+    IMU INT: GPIO35 - MPU6050 data ready
 
 UART Protocol (115200 baud, 8N1):
     Commands (from Zero or WiFi):
@@ -33,26 +34,226 @@ UART Protocol (115200 baud, 8N1):
         IMU:<roll>,<pitch>,<yaw>
         DIST:<front>,<left>,<right>
         BAT:<voltage>,<current>,<soc>
+
+    Request IDs:
+        A command may end with ;#<id> (e.g. W:50,0;#42). Every response
+        line to it then ends with the same ;#<id> so the sender can match
+        replies to requests. Unsolicited WARN/ERR lines carry no ID.
 """
 
 import time
+import _thread
+import esp
+import asyncio
+import micropython
+from array import array
+from math import atan, degrees
 from machine import Pin, I2C, UART
 
+# Optional modules - a missing file leaves that hardware disabled
+try:
+    from pca9685 import PCA9685
+except ImportError:
+    PCA9685 = None
+try:
+    from hexapod import Hexapod
+    from gait import GaitController, RippleGait
+except ImportError:
+    Hexapod = GaitController = RippleGait = None
+try:
+    from mpu6050 import MPU6050
+except ImportError:
+    MPU6050 = None
+try:
+    from vl53l0x import VL53L0XArray
+except ImportError:
+    VL53L0XArray = None
+try:
+    from ina219 import INA219, BatteryMonitor
+except ImportError:
+    INA219 = BatteryMonitor = None
+
 # ESP32 Pin Configuration
 # I2C0 on GPIO21/GPIO22
-i2c = I2C(0, sda=Pin(21), scl=Pin(22), freq=400000)
+# Only the PCA9685 supports 1 MHz Fast-mode Plus; MPU6050, VL53L0X and
+# INA219 (without HS-mode entry) are 400 kHz parts on this shared bus.
+I2C_FREQ = 400000
+i2c = I2C(0, sda=Pin(21), scl=Pin(22), freq=I2C_FREQ)
 
 # UART2 on GPIO16/GPIO17 (for Zero communication, optional)
-uart = UART(2, baudrate=115200, tx=Pin(17), rx=Pin(16))
+uart = UART(2, baudrate=115200, tx=Pin(17), rx=Pin(16), txbuf=2048)
 
 # XSHUT pins for VL53L0X sensors
 XSHUT_PINS = [Pin(25, Pin.OUT), Pin(26, Pin.OUT), Pin(27, Pin.OUT)]
 
+# MPU6050 INT (data ready) input, None to poll the IMU from an asyncio task
+IMU_INT_PIN = 35
+
 # Default gait settings (optimized for femur torque)
 DEFAULT_GAIT = 'wave'       # 5 legs down = less load per leg
 DEFAULT_HEIGHT = 40         # Lower stance = less femur torque
 DEFAULT_SPEED = 0.8         # Slower = less dynamic load
 
+# Event timing (ms)
+BALANCE_INTERVAL_MS = 100   # IMU tilt check period (polling fallback / cache age)
+IMU_RATE_HZ = 50            # MPU6050 data-ready rate when INT is wired
+BATTERY_INTERVAL_MS = 5000  # Battery check period
+
+# UART TX buffering
+TX_BUF_SIZE = 1024
+TX_FLUSH_AT = 768
+
+# Prebuilt responses (avoid str -> bytes encode per reply)
+_OK = b'OK\n'
+_OK_BODY = b'OK'  # before a request ID suffix
+_READY = b'READY\n'
+_NL = b'\n'
+_ERR_PREFIX = b'ERR:'
+_ERR_NO_GAIT = b'Gait controller not available'
+_ERR_CRITICAL_BATTERY = b'ERR:CRITICAL_BATTERY\n'
+_WARN_LOW_BATTERY = b'WARN:LOW_BATTERY\n'
+_GAIT_NAMES = {'tripod': b'tripod', 'wave': b'wave', 'ripple': b'ripple'}
+
+
+def _put_int(buf, pos, v):
+    """Write signed decimal int v into buf at pos. Returns end position."""
+    if v < 0:
+        buf[pos] = 45  # '-'
+        pos += 1
+        v = -v
+    start = pos
+    while True:
+        buf[pos] = 48 + v % 10
+        pos += 1
+        v //= 10
+        if not v:
+            break
+    # Digits were written least significant first - reverse in place
+    end = pos - 1
+    while start < end:
+        buf[start], buf[end] = buf[end], buf[start]
+        start += 1
+        end -= 1
+    return pos
+
+
+def _put_fixed(buf, pos, v, decimals):
+    """Write float v with fixed decimals into buf at pos. Returns end position."""
+    scale = 10 ** decimals
+    n = int(v * scale + (0.5 if v >= 0 else -0.5))
+    if n < 0:
+        buf[pos] = 45  # '-'
+        pos += 1
+        n = -n
+    pos = _put_int(buf, pos, n // scale)
+    if decimals:
+        buf[pos] = 46  # '.'
+        pos += 1
+        frac = n % scale
+        while scale > 1:
+            scale //= 10
+            buf[pos] = 48 + (frac // scale) % 10
+            pos += 1
+    return pos
+
+
+@micropython.viper
+def _parse_walk_tenths(buf: ptr8, n: int) -> int:
+    """
+    Parse b'<dx>[,<dy>]' in place, without float() or split().
+
+    Values are fixed-point tenths of a mm (|value| < 3276.8 mm), packed
+    as (dx & 0xFFFF) | (dy << 16). Extra fractional digits are truncated.
+    Raises ValueError for an empty field or a value out of range.
+    """
+    dx = 0
+    field = 0
+    val = 0
+    neg = 0
+    dot = 0
+    frac = 0
+    digits = 0
+    i = 0
+    while i < n:
+        c = buf[i]
+        if c == 44 and field == 0:  # ','
+            if digits == 0:
+                raise ValueError("bad walk argument")
+            if frac == 0:
+                val *= 10
+            if val > 32767:
+                raise ValueError("walk distance out of range")
+            dx = -val if neg else val
+            field = 1
+            val = 0
+            neg = 0
+            dot = 0
+            frac = 0
+            digits = 0
+        elif c >= 48 and c <= 57:  # '0'-'9'
+            digits = 1
+            if dot == 0:
+                val = val * 10 + c - 48
+            elif frac == 0:
+                val = val * 10 + c - 48
+                frac = 1
+            if val > 32767:
+                raise ValueError("walk distance out of range")
+        elif c == 46 and dot == 0:  # '.'
+            dot = 1
+        elif c == 45 and val == 0 and dot == 0:  # '-'
+            neg = 1
+        elif c != 43 and c != 32:  # '+' and ' ' are ignored
+            raise ValueError("bad walk argument")
+        i += 1
+    if digits == 0:
+        raise ValueError("bad walk argument")
+    if frac == 0:
+        val *= 10
+    if val > 32767:
+        raise ValueError("walk distance out of range")
+    if neg:
+        val = -val
+    if field == 0:
+        # W:<dx> - no dy given
+        return val & 0xFFFF
+    return (dx & 0xFFFF) | (val << 16)
+
+
+# atan(k/32) in tenths of a degree, k = 0..32 (first octant)
+_ATAN_LUT = array('h', [int(degrees(atan(k / 32)) * 10 + 0.5) for k in range(33)])
+
+
+@micropython.viper
+def _walk_polar(dx: int, dy: int) -> int:
+    """
+    Integer atan2/hypot for walk vectors in tenths of a mm.
+
+    Angle comes from a first-octant LUT (within 1 degree), distance from
+    alpha-max-plus-beta-min (~2%) - both well below the 30mm/step
+    gait resolution. Packed as (angle_tenths + 1800) | (dist_tenths << 12).
+    """
+    lut = ptr16(_ATAN_LUT)
+    ax = dx if dx >= 0 else -dx
+    ay = dy if dy >= 0 else -dy
+    mx = ax if ax > ay else ay
+    mn = ay if ax > ay else ax
+    if mx == 0:
+        return 1800
+    # max(mx + 5/32 mn, 27/32 mx + 71/128 mn)
+    dist = mx + ((5 * mn) >> 5)
+    d2 = (108 * mx + 71 * mn) >> 7
+    if d2 > dist:
+        dist = d2
+    a = int(lut[(mn * 32 + (mx >> 1)) // mx])
+    if ay > ax:
+        a = 900 - a
+    if dx < 0:
+        a = 1800 - a
+    if dy < 0:
+        a = -a
+    return (a + 1800) | (dist << 12)
+
 
 class ESP32Controller:
     """Main controller for ESP32 - handles commands and sensors."""
@@ -64,6 +265,45 @@ class ESP32Controller:
         self.speed = DEFAULT_SPEED
         self.walking = False
 
+        # IMU data-ready pin (set up in run())
+        self._imu_int = None
+
+        # Latest IMU sample, shared by balance check and IMU query
+        self._accel = (0, 0, 0)  # last read_accel() counts
+        self._imu_ticks = None
+
+        # Reusable buffer for status/IMU/DIST/BAT responses (room for a
+        # request ID suffix)
+        self._fmt_buf = bytearray(96)
+        self._fmt_mv = memoryview(self._fmt_buf)
+
+        # Outgoing UART buffer, flushed per command or when nearly full
+        self._txbuf = bytearray(TX_BUF_SIZE)
+        self._txmv = memoryview(self._txbuf)
+        self._txlen = 0
+
+        # ';#<id>' suffix of the command being handled, echoed on replies
+        self._tag = b''
+
+        # Command dispatch tables (bytes keys, no decode needed)
+        self._arg_cmds = {
+            b'W': self._parse_walk,      # Walk: W:<dx>,<dy>
+            b'T': self._parse_turn,      # Turn: T:<angle>
+            b'G': self._parse_gait,      # Set gait: G:<gait>
+            b'H': self._parse_height,    # Set height: H:<mm>
+            b'V': self._parse_speed,     # Set speed: V:<0.0-1.0>
+        }
+        self._bare_cmds = {
+            b'S': self._cmd_stop,
+            b'C': self._cmd_center,
+            b'B': self._cmd_boot,
+            b'D': self._cmd_shutdown,
+            b'?': self._cmd_status,
+            b'IMU': self._cmd_imu,
+            b'DIST': self._cmd_dist,
+            b'BAT': self._cmd_bat,
+        }
+
         # Initialize components
         self._init_hardware()
 
@@ -71,197 +311,252 @@ class ESP32Controller:
         """Initialize all hardware components."""
         print("Initializing hardware...")
 
-        # PCA9685 PWM drivers
-        try:
-            from pca9685 import PCA9685
-            self.pca1 = PCA9685(i2c, address=0x40, freq=50)
-            self.pca2 = PCA9685(i2c, address=0x41, freq=50)
-            print("  PCA9685 x2: OK")
-        except Exception as e:
-            print(f"  PCA9685: FAIL - {e}")
-            self.pca1 = None
-            self.pca2 = None
+        self.pca1 = None
+        self.pca2 = None
+        self.hexapod = None
+        self.gait = None
+        self.ripple = None
+        self.imu = None
+        self.distance = None
+        self.battery = None
 
-        # Hexapod and gait controller
-        try:
-            from hexapod import Hexapod
-            from gait import GaitController
-            pca_drivers = [self.pca1, self.pca2] if self.pca1 else None
-            self.hexapod = Hexapod(pca_drivers=pca_drivers,
-                                   simulate=(pca_drivers is None))
-            self.gait = GaitController(self.hexapod)
-            self.gait.speed = self.speed
-            print("  Hexapod: OK")
-        except Exception as e:
-            print(f"  Hexapod: FAIL - {e}")
-            self.hexapod = None
-            self.gait = None
+        # PCA9685 PWM drivers
+        if PCA9685:
+            try:
+                self.pca1 = PCA9685(i2c, address=0x40, freq=50)
+                self.pca2 = PCA9685(i2c, address=0x41, freq=50)
+                print("  PCA9685 x2: OK")
+            except OSError as e:
+                print(f"  PCA9685: FAIL - {e}")
+                self.pca1 = None
+                self.pca2 = None
+        else:
+            print("  PCA9685: FAIL - driver missing")
+
+        # Hexapod and gait controller (no I2C of its own, any error disables it)
+        if Hexapod and GaitController:
+            try:
+                pca_drivers = [self.pca1, self.pca2] if self.pca1 else None
+                self.hexapod = Hexapod(pca_drivers=pca_drivers,
+                                       simulate=(pca_drivers is None))
+                self.gait = GaitController(self.hexapod)
+                self.gait.speed = self.speed
+                self.ripple = RippleGait(self.hexapod)
+                self.ripple.speed = self.speed
+                print("  Hexapod: OK")
+            except Exception as e:
+                print(f"  Hexapod: FAIL - {e}")
+                self.hexapod = None
+                self.gait = None
+                self.ripple = None
+        else:
+            print("  Hexapod: FAIL - module missing")
 
         # MPU6050 IMU
-        try:
-            from mpu6050 import MPU6050
-            self.imu = MPU6050(i2c, address=0x68)
-            print("  MPU6050: OK")
-        except Exception as e:
-            print(f"  MPU6050: FAIL - {e}")
-            self.imu = None
+        if MPU6050:
+            try:
+                self.imu = MPU6050(i2c, address=0x68)
+                print("  MPU6050: OK")
+            except OSError as e:
+                print(f"  MPU6050: FAIL - {e}")
+        else:
+            print("  MPU6050: FAIL - driver missing")
 
         # VL53L0X distance sensors
-        try:
-            from vl53l0x import VL53L0XArray
-            self.distance = VL53L0XArray(i2c, XSHUT_PINS,
-                                         addresses=[0x29, 0x30, 0x31])
-            print("  VL53L0X x3: OK")
-        except Exception as e:
-            print(f"  VL53L0X: FAIL - {e}")
-            self.distance = None
+        if VL53L0XArray:
+            try:
+                self.distance = VL53L0XArray(i2c, XSHUT_PINS,
+                                             addresses=[0x29, 0x30, 0x31])
+                print("  VL53L0X x3: OK")
+            except OSError as e:
+                print(f"  VL53L0X: FAIL - {e}")
+        else:
+            print("  VL53L0X: FAIL - driver missing")
 
         # INA219 battery monitor
-        try:
-            from ina219 import INA219, BatteryMonitor
-            ina = INA219(i2c, address=0x44)
-            self.battery = BatteryMonitor(ina, cell_count=3)
-            print("  INA219: OK")
-        except Exception as e:
-            print(f"  INA219: FAIL - {e}")
-            self.battery = None
+        if INA219:
+            try:
+                # Triggered mode: battery is only polled every few seconds
+                ina = INA219(i2c, address=0x44, continuous=False)
+                self.battery = BatteryMonitor(ina, cell_count=3)
+                print("  INA219: OK")
+            except OSError as e:
+                print(f"  INA219: FAIL - {e}")
+        else:
+            print("  INA219: FAIL - driver missing")
 
         print("Hardware init complete")
 
     def send_response(self, msg):
         """Send response via UART."""
-        uart.write(f"{msg}\n".encode())
-
+        self._tx(msg.encode())
+        self._end_line()
+
+    def send_ok(self):
+        """Send plain OK response."""
+        if self._tag:
+            self._tx(_OK_BODY)
+            self._end_line()
+        else:
+            self._tx(_OK)
+
+    def send_err(self, msg):
+        """Send ERR:<msg> response (msg may be str or bytes)."""
+        if isinstance(msg, str):
+            msg = msg.encode()
+        self._tx(_ERR_PREFIX)
+        self._tx(msg)
+        self._end_line()
+
+    def _end_line(self):
+        """Terminate a response line, echoing the request ID if any."""
+        if self._tag:
+            self._tx(self._tag)
+        self._tx(_NL)
+
+    def _send_fmt(self, pos):
+        """Terminate, queue and flush the first pos bytes of the format buffer."""
+        buf = self._fmt_buf
+        tag = self._tag
+        if tag:
+            end = pos + len(tag)
+            buf[pos:end] = tag
+            pos = end
+        buf[pos] = 10  # '\n'
+        self._tx(self._fmt_mv[:pos + 1])
+        self.flush()
+
+    def _tx(self, data):
+        """Append bytes to the TX buffer, flushing when it fills."""
+        n = len(data)
+        if self._txlen + n > TX_BUF_SIZE:
+            self.flush()
+            if n > TX_BUF_SIZE:
+                uart.write(data)
+                return
+        self._txmv[self._txlen:self._txlen + n] = data
+        self._txlen += n
+        if self._txlen > TX_FLUSH_AT:
+            self.flush()
+
+    def flush(self):
+        """Write buffered responses to the UART in one call."""
+        if self._txlen:
+            uart.write(self._txmv[:self._txlen])
+            self._txlen = 0
+
+    @micropython.native
     def handle_command(self, cmd):
         """
         Parse and execute command.
 
         Args:
-            cmd: Command string (without newline)
+            cmd: Command bytes (newline optional)
         """
         cmd = cmd.strip()
         if not cmd:
             return
 
-        try:
-            # Parse command
-            if cmd.startswith('W:'):
-                # Walk: W:<dx>,<dy>
-                parts = cmd[2:].split(',')
-                dx = float(parts[0])
-                dy = float(parts[1]) if len(parts) > 1 else 0
-                self._cmd_walk(dx, dy)
-
-            elif cmd.startswith('T:'):
-                # Turn: T:<angle>
-                angle = float(cmd[2:])
-                self._cmd_turn(angle)
-
-            elif cmd == 'S':
-                # Stop
-                self._cmd_stop()
-
-            elif cmd.startswith('G:'):
-                # Set gait: G:<gait>
-                gait = cmd[2:].strip().lower()
-                self._cmd_set_gait(gait)
-
-            elif cmd.startswith('H:'):
-                # Set height: H:<mm>
-                height = int(cmd[2:])
-                self._cmd_set_height(height)
-
-            elif cmd.startswith('V:'):
-                # Set speed: V:<0.0-1.0>
-                speed = float(cmd[2:])
-                self._cmd_set_speed(speed)
-
-            elif cmd == 'C':
-                # Center all servos
-                self._cmd_center()
-
-            elif cmd == 'B':
-                # Boot up
-                self._cmd_boot()
-
-            elif cmd == 'D':
-                # Shut down
-                self._cmd_shutdown()
-
-            elif cmd == '?':
-                # Query status
-                self._cmd_status()
-
-            elif cmd == 'IMU':
-                # Query IMU
-                self._cmd_imu()
-
-            elif cmd == 'DIST':
-                # Query distance sensors
-                self._cmd_dist()
-
-            elif cmd == 'BAT':
-                # Query battery
-                self._cmd_bat()
+        # Split off an optional request ID for the replies
+        i = cmd.find(b';#')
+        if i >= 0:
+            self._tag = cmd[i:]
+            cmd = cmd[:i]
 
+        try:
+            if cmd[1:2] == b':':
+                # Prefixed command: <X>:<arg>
+                handler = self._arg_cmds.get(cmd[0:1])
+                if handler:
+                    handler(cmd[2:])
+                    return
             else:
-                self.send_response(f"ERR:Unknown command: {cmd}")
+                handler = self._bare_cmds.get(cmd)
+                if handler:
+                    handler()
+                    return
+
+            self.send_err(b"Unknown command: " + cmd)
 
         except Exception as e:
-            self.send_response(f"ERR:{e}")
+            self.send_err(str(e))
+        finally:
+            self._tag = b''
+
+    def _parse_walk(self, arg):
+        """W:<dx>,<dy>"""
+        v = _parse_walk_tenths(arg, len(arg))
+        dx = v & 0xFFFF
+        if dx & 0x8000:
+            dx -= 0x10000
+        self._cmd_walk(dx, v >> 16)
+
+    def _parse_turn(self, arg):
+        """T:<angle>"""
+        self._cmd_turn(float(arg))
+
+    def _parse_gait(self, arg):
+        """G:<gait>"""
+        self._cmd_set_gait(arg.strip().lower().decode())
+
+    def _parse_height(self, arg):
+        """H:<mm>"""
+        self._cmd_set_height(int(arg))
+
+    def _parse_speed(self, arg):
+        """V:<0.0-1.0>"""
+        self._cmd_set_speed(float(arg))
 
     def _cmd_walk(self, dx, dy):
-        """Walk command with smooth acceleration."""
+        """Walk command with smooth acceleration (dx, dy in tenths of a mm)."""
         if not self.gait:
-            self.send_response("ERR:Gait controller not available")
+            self.send_err(_ERR_NO_GAIT)
             return
 
-        import math
-        direction = math.degrees(math.atan2(dy, dx))
-        distance = math.sqrt(dx*dx + dy*dy)
-        steps = max(1, int(distance / 30))
+        v = _walk_polar(dx, dy)
+        direction = ((v & 0xFFF) - 1800) * 0.1
+        steps = max(1, (v >> 12) // 300)
 
         if self.gait_type == 'tripod':
             self.gait.walk(direction=direction, steps=steps)
         elif self.gait_type == 'wave':
             self.gait.wave_walk(direction=direction, steps=steps)
         elif self.gait_type == 'ripple':
-            from gait import RippleGait
-            ripple = RippleGait(self.hexapod)
-            ripple.walk(direction=direction, steps=steps)
+            self.ripple.walk(direction=direction, steps=steps)
 
-        self.send_response("OK")
+        self.send_ok()
 
     def _cmd_turn(self, angle):
         """Turn in place command."""
         if not self.gait:
-            self.send_response("ERR:Gait controller not available")
+            self.send_err(_ERR_NO_GAIT)
             return
 
         steps = max(1, abs(int(angle / 15)))
         self.gait.rotate(angle=angle/steps, steps=steps)
-        self.send_response("OK")
+        self.send_ok()
 
     def _cmd_stop(self):
         """Stop walking and stand."""
         if self.gait:
             self.gait.stand(self.height)
         self.walking = False
-        self.send_response("OK")
+        self.send_ok()
 
     def _cmd_set_gait(self, gait):
         """Set gait type."""
-        if gait in ['tripod', 'wave', 'ripple']:
+        if gait in _GAIT_NAMES:
             self.gait_type = gait
             self.send_response(f"OK:{gait}")
         else:
-            self.send_response(f"ERR:Unknown gait: {gait}")
+            self.send_err("Unknown gait: " + gait)
 
     def _cmd_set_height(self, height):
         """Set standing height."""
         self.height = max(20, min(80, height))
         if self.gait:
             self.gait.stand_height = self.height
+            self.ripple.stand_height = self.height
             self.gait.stand(self.height)
         self.send_response(f"OK:{self.height}")
 
@@ -270,76 +565,133 @@ class ESP32Controller:
         self.speed = max(0.1, min(1.0, speed))
         if self.gait:
             self.gait.speed = self.speed
+            self.ripple.speed = self.speed
         self.send_response(f"OK:{self.speed}")
 
     def _cmd_center(self):
         """Center all servos."""
         if self.hexapod:
             self.hexapod.center_all()
-        self.send_response("OK")
+        self.send_ok()
 
     def _cmd_boot(self):
         """Boot up sequence."""
         if self.gait:
             self.gait.boot_up()
-        self.send_response("OK")
+        self.send_ok()
 
     def _cmd_shutdown(self):
         """Shutdown sequence."""
         if self.gait:
             self.gait.shut_down()
-        self.send_response("OK")
+        self.send_ok()
 
     def _cmd_status(self):
-        """Query status."""
-        status = {
-            'gait': self.gait_type,
-            'height': self.height,
-            'speed': self.speed,
-            'walking': self.walking,
-            'hw': {
-                'pca': self.pca1 is not None,
-                'imu': self.imu is not None,
-                'dist': self.distance is not None,
-                'bat': self.battery is not None,
-            }
-        }
-        self.send_response(f"OK:{status}")
+        """
+        Query status.
+
+        Format: OK:gait=<g>,h=<mm>,v=<speed>,walking=<0|1>,pca=<0|1>,imu=<0|1>,dist=<0|1>,bat=<0|1>
+        """
+        buf = self._fmt_buf
+        buf[0:8] = b'OK:gait='
+        name = _GAIT_NAMES[self.gait_type]
+        pos = 8 + len(name)
+        buf[8:pos] = name
+        buf[pos:pos + 3] = b',h='
+        pos = _put_int(buf, pos + 3, self.height)
+        buf[pos:pos + 3] = b',v='
+        pos = _put_fixed(buf, pos + 3, self.speed, 1)
+        buf[pos:pos + 9] = b',walking='
+        buf[pos + 9] = 49 if self.walking else 48
+        buf[pos + 10:pos + 15] = b',pca='
+        buf[pos + 15] = 49 if self.pca1 is not None else 48
+        buf[pos + 16:pos + 21] = b',imu='
+        buf[pos + 21] = 49 if self.imu is not None else 48
+        buf[pos + 22:pos + 28] = b',dist='
+        buf[pos + 28] = 49 if self.distance is not None else 48
+        buf[pos + 29:pos + 34] = b',bat='
+        buf[pos + 34] = 49 if self.battery is not None else 48
+        self._send_fmt(pos + 35)
 
     def _cmd_imu(self):
         """Query IMU data."""
         if not self.imu:
-            self.send_response("ERR:IMU not available")
+            self.send_err(b"IMU not available")
             return
 
-        roll, pitch = self.imu.get_roll_pitch()
-        self.send_response(f"IMU:{roll:.1f},{pitch:.1f},0")
+        roll, pitch = self._get_roll_pitch()
+        buf = self._fmt_buf
+        buf[0:4] = b'IMU:'
+        pos = _put_fixed(buf, 4, roll, 1)
+        buf[pos] = 44  # ','
+        pos = _put_fixed(buf, pos + 1, pitch, 1)
+        buf[pos:pos + 2] = b',0'
+        self._send_fmt(pos + 2)
 
     def _cmd_dist(self):
         """Query distance sensors."""
         if not self.distance:
-            self.send_response("ERR:Distance sensors not available")
+            self.send_err(b"Distance sensors not available")
             return
 
         readings = self.distance.read_all()
-        self.send_response(f"DIST:{readings[0]},{readings[1]},{readings[2]}")
+        buf = self._fmt_buf
+        buf[0:5] = b'DIST:'
+        pos = _put_int(buf, 5, readings[0])
+        buf[pos] = 44
+        pos = _put_int(buf, pos + 1, readings[1])
+        buf[pos] = 44
+        pos = _put_int(buf, pos + 1, readings[2])
+        self._send_fmt(pos)
 
     def _cmd_bat(self):
         """Query battery status."""
         if not self.battery:
-            self.send_response("ERR:Battery monitor not available")
+            self.send_err(b"Battery monitor not available")
             return
 
         status = self.battery.get_status()
-        self.send_response(f"BAT:{status['voltage']:.2f},{status['current']:.2f},{status['soc_percent']:.0f}")
+        buf = self._fmt_buf
+        buf[0:4] = b'BAT:'
+        pos = _put_fixed(buf, 4, status['voltage'], 2)
+        buf[pos] = 44
+        pos = _put_fixed(buf, pos + 1, status['current'], 2)
+        buf[pos] = 44
+        pos = _put_fixed(buf, pos + 1, status['soc_percent'], 0)
+        self._send_fmt(pos)
+
+    def _read_imu(self):
+        """Read IMU once and cache the accel counts."""
+        self._accel = accel = self.imu.read_accel()
+        self._imu_ticks = time.ticks_ms()
+        return accel
+
+    def _get_roll_pitch(self):
+        """Return exact roll/pitch, reading the IMU only if stale."""
+        # The cache is filled every sample by the data-ready IRQ (or by
+        # _imu_task when INT is not wired), so this normally reuses it
+        if (self._imu_ticks is None or
+                time.ticks_diff(time.ticks_ms(), self._imu_ticks) >= BALANCE_INTERVAL_MS):
+            self._read_imu()
+        ax, ay, az = self._accel
+        return self.imu.roll_pitch(ax, ay, az)
+
+    def _on_imu_ready(self, _pin):
+        """MPU6050 data-ready IRQ - read the new sample and check tilt."""
+        self.check_balance()
 
     def check_balance(self):
         """Check IMU and adjust if tilting too much."""
         if not self.imu:
             return
 
-        roll, pitch = self.imu.get_roll_pitch()
+        ax, ay, az = self._read_imu()
+        # Small-angle path while near level; exact math once tilted
+        roll, pitch = self.imu.roll_pitch_fast(ax, ay, az)
+        self._check_tilt(roll, pitch)
 
+    def _check_tilt(self, roll, pitch):
+        """Warn if roll/pitch indicate the robot may be falling."""
         # If tilting more than 30 degrees, might be falling
         if abs(roll) > 30 or abs(pitch) > 30:
             print(f"Warning: Tilt detected! Roll={roll:.1f}, Pitch={pitch:.1f}")
@@ -350,56 +702,99 @@ class ESP32Controller:
         if not self.battery:
             return
 
-        if self.battery.is_critical():
-            self.send_response("ERR:CRITICAL_BATTERY")
+        # One voltage read per check, classified locally
+        level = self.battery.get_level()
+        if level == 'critical':
+            self._tx(_ERR_CRITICAL_BATTERY)
+            self.flush()
             # Emergency shutdown
             if self.gait:
                 self.gait.shut_down()
             self.running = False
-        elif self.battery.is_low_battery():
-            self.send_response("WARN:LOW_BATTERY")
+        elif level == 'low':
+            self._tx(_WARN_LOW_BATTERY)
+            self.flush()
+
+    async def _cmd_task(self):
+        """Read UART lines and execute them as they arrive."""
+        reader = asyncio.StreamReader(uart)
+        while True:
+            line = await reader.readline()
+            if not line:
+                continue
+            try:
+                self.handle_command(line)
+            except Exception as e:
+                self.send_err("Parse error: " + str(e))
+            # One UART write per command, before the next (possibly long) one runs
+            self.flush()
+
+    async def _imu_task(self):
+        """Poll the IMU for tilt when its INT pin is not wired."""
+        while True:
+            self.check_balance()
+            await asyncio.sleep_ms(BALANCE_INTERVAL_MS)
+
+    async def _battery_task(self):
+        """Check the battery periodically until the controller stops."""
+        while self.running:
+            await asyncio.sleep_ms(BATTERY_INTERVAL_MS)
+            self.check_battery()
+
+    async def _main(self):
+        """Run command and sensor tasks concurrently."""
+        tasks = [asyncio.create_task(self._cmd_task())]
+
+        if self.imu and IMU_INT_PIN is not None:
+            # Pin IRQs are soft on ESP32 (run via the scheduler), so the
+            # handler reads I2C directly - even while a gait command sleeps
+            self.imu.set_sample_rate(IMU_RATE_HZ)
+            self.imu.enable_data_ready_interrupt()
+            self._imu_int = Pin(IMU_INT_PIN, Pin.IN)
+            self._imu_int.irq(trigger=Pin.IRQ_RISING, handler=self._on_imu_ready)
+        elif self.imu:
+            tasks.append(asyncio.create_task(self._imu_task()))
+
+        try:
+            # Returns once check_battery() clears self.running
+            await self._battery_task()
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self._imu_int:
+                self._imu_int.irq(handler=None)
+                self.imu.disable_interrupts()
 
     def run(self):
-        """Main control loop."""
+        """Main control loop (asyncio, no busy polling)."""
         print("ESP32 controller starting...")
         print(f"  Default gait: {self.gait_type}")
         print(f"  Default height: {self.height}mm")
         print(f"  Default speed: {self.speed}")
-        self.send_response("READY")
-
-        last_sensor_check = time.ticks_ms()
-        sensor_interval = 100  # Check sensors every 100ms
+        self._tx(_READY)
+        self.flush()
 
-        while self.running:
-            # Check for UART commands
-            if uart.any():
-                line = uart.readline()
-                if line:
-                    try:
-                        cmd = line.decode().strip()
-                        self.handle_command(cmd)
-                    except Exception as e:
-                        self.send_response(f"ERR:Parse error: {e}")
-
-            # Periodic sensor checks
-            now = time.ticks_ms()
-            if time.ticks_diff(now, last_sensor_check) >= sensor_interval:
-                last_sensor_check = now
-                self.check_balance()
-
-                # Battery check less frequently
-                if now % 5000 < sensor_interval:
-                    self.check_battery()
-
-            # Small delay to prevent busy-waiting
-            time.sleep(0.01)
+        asyncio.run(self._main())
 
         print("ESP32 controller stopped")
 
 
-def main():
-    """Entry point."""
+def main(background=False):
+    """
+    Entry point.
+
+    Args:
+        background: Run the controller in its own thread and return it,
+            leaving the REPL/WebREPL usable. The interpreter (and every
+            Python thread) already runs on core 1, away from WiFi/BT on core 0.
+    """
+    # Silence ESP-IDF log output so it doesn't stall the UART/REPL
+    esp.osdebug(None)
+
     controller = ESP32Controller()
+    if background:
+        _thread.start_new_thread(controller.run, ())
+        return controller
     controller.run()
 
 
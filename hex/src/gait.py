@@ -8,13 +8,45 @@ Optimized for MG90S femur servos with smooth acceleration
 to reduce peak torque and prevent gear stripping.
 """
 
-import math
+from math import cos, sin, radians
 from time import sleep
 
+from hexapod import LEG_ANGLES
+
+try:
+    # MicroPython: wrap-safe microsecond ticks
+    from time import ticks_us, ticks_add, ticks_diff, sleep_us
+
+    def _deadline(t):
+        """Return a deadline t seconds from now."""
+        return ticks_add(ticks_us(), int(t * 1000000))
+
+    def _sleep_until(deadline):
+        """Sleep for whatever is left until deadline (if anything)."""
+        remaining = ticks_diff(deadline, ticks_us())
+        if remaining > 0:
+            sleep_us(remaining)
+except ImportError:
+    # CPython
+    from time import monotonic
+
+    def _deadline(t):
+        """Return a deadline t seconds from now."""
+        return monotonic() + t
+
+    def _sleep_until(deadline):
+        """Sleep for whatever is left until deadline (if anything)."""
+        remaining = deadline - monotonic()
+        if remaining > 0:
+            sleep(remaining)
+
 
 # Smooth motion interpolation steps (more = smoother but slower)
 SMOOTH_STEPS = 5
 
+# Leg mounting angles in radians (fixed for this body)
+_LEG_ANGLES_RAD = {leg: radians(a) for leg, a in LEG_ANGLES.items()}
+
 
 def lerp(start, end, t):
     """Linear interpolation between start and end."""
@@ -27,7 +59,120 @@ def ease_in_out(t):
     if t < 0.5:
         return 4 * t * t * t
     else:
-        return 1 - pow(-2 * t + 2, 3) / 2
+        u = -2 * t + 2
+        return 1 - u * u * u / 2
+
+
+# (direction, step_length) -> (dx, dy, dx/6, dy/6), see _step_components()
+_step_cache = {}
+_STEP_CACHE_SIZE = 8
+
+
+def _step_components(direction, step_length):
+    """
+    Split a step into x/y components (cached - gaits repeat directions).
+
+    Returns:
+        (dx, dy, shift_dx, shift_dy) where shift is the 1/6 per-leg
+        stance push used by the wave and ripple gaits
+    """
+    key = (direction, step_length)
+    parts = _step_cache.get(key)
+    if parts is None:
+        if len(_step_cache) >= _STEP_CACHE_SIZE:
+            _step_cache.clear()
+        rad = radians(direction)
+        dx = step_length * cos(rad)
+        dy = step_length * sin(rad)
+        parts = (dx, dy, dx / 6, dy / 6)
+        _step_cache[key] = parts
+    return parts
+
+
+def _stance_groups(sequence):
+    """Return (leg, other_legs) for each leg in sequence."""
+    return [(leg, [other for other in sequence if other != leg])
+            for leg in sequence]
+
+
+def _shifted(positions, legs, dx, dy):
+    """
+    Translate a group of legs in XY, reading every position first.
+
+    Args:
+        positions: Hexapod leg_positions dict
+        legs: Leg names to shift
+        dx, dy: Offset to add (mm)
+
+    Returns:
+        Dict of {leg_name: (x, y, z)} targets
+    """
+    shifted = {}
+    for leg in legs:
+        x, y, z = positions[leg]
+        shifted[leg] = (x + dx, y + dy, z)
+    return shifted
+
+
+def _tripod_targets(positions, swing_legs, stance_legs, dx, dy, lift, plant_z):
+    """
+    Compute every target for one tripod half cycle up front.
+
+    Args:
+        positions: Hexapod leg_positions dict
+        swing_legs, stance_legs: Leg groups
+        dx, dy: Step components (each phase moves half)
+        lift: Swing leg lift height (mm)
+        plant_z: Height to plant swing legs at
+
+    Returns:
+        (swing, plant) dicts of {leg_name: (x, y, z)}. swing also holds
+        the stance push-back, which happens in the same phase.
+    """
+    half_dx = dx / 2
+    half_dy = dy / 2
+    swing = {}
+    plant = {}
+    for leg in swing_legs:
+        x, y, z = positions[leg]
+        x += half_dx
+        y += half_dy
+        swing[leg] = (x, y, z + lift)
+        plant[leg] = (x, y, plant_z)
+    for leg in stance_legs:
+        x, y, z = positions[leg]
+        # Push back (propel body forward)
+        swing[leg] = (x - half_dx, y - half_dy, z)
+    return swing, plant
+
+
+# Legs closer than this to their target (mm, per axis) are not re-sent
+AT_TARGET_MM = 0.5
+
+
+def _pending(positions, targets):
+    """Return only the targets whose leg isn't already there."""
+    pending = {}
+    for leg, target in targets.items():
+        x, y, z = positions[leg]
+        tx, ty, tz = target
+        if (abs(x - tx) > AT_TARGET_MM or abs(y - ty) > AT_TARGET_MM or
+                abs(z - tz) > AT_TARGET_MM):
+            pending[leg] = target
+    return pending
+
+
+# Ease samples per smooth_steps value, built on first use
+_ease_tables = {}
+
+
+def _ease_table(steps):
+    """Return ease_in_out(i / steps) for i = 1..steps (cached)."""
+    table = _ease_tables.get(steps)
+    if table is None:
+        table = tuple(ease_in_out(i / steps) for i in range(1, steps + 1))
+        _ease_tables[steps] = table
+    return table
 
 
 class GaitController:
@@ -63,20 +208,77 @@ class GaitController:
 
         # Default positions - optimized for MG90S femur servos
         self.stand_height = 40  # mm below coxa (lower = less femur torque)
-        self.stance_width = 80  # mm out from body
+        self.stance_width = 80  # mm out from body (builds _default_stance)
 
         # Speed multiplier (0.1 to 1.0) - lower = slower, gentler on servos
         self.speed = 0.8
 
-        # Smooth motion control
-        self.smooth_motion = True  # Enable smooth ramping
-        self.smooth_steps = SMOOTH_STEPS
+        # Smooth motion control (setters pick the move helpers)
+        self._smooth_motion = True  # Enable smooth ramping
+        self._smooth_steps = SMOOTH_STEPS
+        self._select_motion()
+
+    @property
+    def stance_width(self):
+        """Distance of each foot out from the body (mm)."""
+        return self._stance_width
+
+    @stance_width.setter
+    def stance_width(self, width):
+        # Default stance only changes with width - precompute it here
+        # rather than redoing the trig on every reset_positions()
+        self._stance_width = width
+        self._default_stance = {}
+        for leg, angle_rad in _LEG_ANGLES_RAD.items():
+            self._default_stance[leg] = (width * cos(angle_rad),
+                                         width * sin(angle_rad))
+
+    @property
+    def smooth_motion(self):
+        """Ramp moves with ease-in-out (True) or move instantly."""
+        return self._smooth_motion
+
+    @smooth_motion.setter
+    def smooth_motion(self, enabled):
+        self._smooth_motion = enabled
+        self._select_motion()
+
+    @property
+    def smooth_steps(self):
+        """Interpolation steps per smooth move."""
+        return self._smooth_steps
+
+    @smooth_steps.setter
+    def smooth_steps(self, steps):
+        self._smooth_steps = steps
+        self._select_motion()
 
     # =========================================================================
     # Smooth Motion Helpers
     # =========================================================================
 
-    def _smooth_move_leg(self, leg, target_x, target_y, target_z, duration=0.1):
+    def _select_motion(self):
+        """
+        Bind _smooth_move_leg(s) for the current smoothing settings.
+
+        Done when the settings change, so moves don't re-check them.
+        """
+        if self._smooth_motion and self._smooth_steps > 1:
+            self._smooth_move_leg = self._ramp_move_leg
+            self._smooth_move_legs = self._ramp_move_legs
+        else:
+            self._smooth_move_leg = self._instant_move_leg
+            self._smooth_move_legs = self._instant_move_legs
+
+    def _instant_move_leg(self, leg, target_x, target_y, target_z, duration=0.1):
+        """Move leg straight to target (smoothing disabled)."""
+        self.hex.move_leg(leg, target_x, target_y, target_z)
+
+    def _instant_move_legs(self, leg_targets, duration=0.1):
+        """Move legs straight to targets (smoothing disabled)."""
+        self.hex.move_legs_bulk(leg_targets)
+
+    def _ramp_move_leg(self, leg, target_x, target_y, target_z, duration=0.1):
         """
         Move leg smoothly with acceleration ramping.
 
@@ -87,15 +289,10 @@ class GaitController:
             target_x, target_y, target_z: Target position
             duration: Total movement time (seconds)
         """
-        if not self.smooth_motion or self.smooth_steps <= 1:
-            self.hex.move_leg(leg, target_x, target_y, target_z)
-            return
-
         start_x, start_y, start_z = self.hex.leg_positions[leg]
         step_delay = duration / self.smooth_steps
 
-        for i in range(1, self.smooth_steps + 1):
-            t = ease_in_out(i / self.smooth_steps)
+        for i, t in enumerate(_ease_table(self.smooth_steps), 1):
             x = lerp(start_x, target_x, t)
             y = lerp(start_y, target_y, t)
             z = lerp(start_z, target_z, t)
@@ -103,7 +300,7 @@ class GaitController:
             if i < self.smooth_steps:
                 sleep(step_delay)
 
-    def _smooth_move_legs(self, leg_targets, duration=0.1):
+    def _ramp_move_legs(self, leg_targets, duration=0.1):
         """
         Move multiple legs smoothly in parallel.
 
@@ -111,28 +308,54 @@ class GaitController:
             leg_targets: Dict of {leg_name: (x, y, z)}
             duration: Total movement time
         """
-        if not self.smooth_motion or self.smooth_steps <= 1:
-            for leg, (x, y, z) in leg_targets.items():
-                self.hex.move_leg(leg, x, y, z)
-            return
+        # Capture start positions and per-leg deltas once, so each ramp
+        # step is just start + delta * t
+        positions = self.hex.leg_positions
+        ramps = []
+        for leg, (target_x, target_y, target_z) in leg_targets.items():
+            start_x, start_y, start_z = positions[leg]
+            ramps.append((leg, start_x, start_y, start_z,
+                          target_x - start_x, target_y - start_y,
+                          target_z - start_z))
+
+        steps = self.smooth_steps
+        step_delay = duration / steps
+        move_legs_bulk = self.hex.move_legs_bulk
+
+        for i, t in enumerate(_ease_table(steps), 1):
+            targets = {}
+            for leg, x, y, z, dx, dy, dz in ramps:
+                targets[leg] = (x + dx * t, y + dy * t, z + dz * t)
+            move_legs_bulk(targets)
+            if i < steps:
+                sleep(step_delay)
 
-        # Capture start positions
-        start_positions = {}
-        for leg in leg_targets:
-            start_positions[leg] = self.hex.leg_positions[leg]
+    def _rotated(self, legs, cos_r, sin_r):
+        """
+        Rotate leg positions about the body centre in one pass.
 
-        step_delay = duration / self.smooth_steps
+        Args:
+            legs: Leg names to rotate
+            cos_r, sin_r: Cosine/sine of the rotation (negate sin_r to invert)
 
-        for i in range(1, self.smooth_steps + 1):
-            t = ease_in_out(i / self.smooth_steps)
-            for leg, (target_x, target_y, target_z) in leg_targets.items():
-                start_x, start_y, start_z = start_positions[leg]
-                x = lerp(start_x, target_x, t)
-                y = lerp(start_y, target_y, t)
-                z = lerp(start_z, target_z, t)
-                self.hex.move_leg(leg, x, y, z)
-            if i < self.smooth_steps:
-                sleep(step_delay)
+        Returns:
+            Dict of {leg_name: (x, y, z)} with z unchanged
+        """
+        positions = self.hex.leg_positions
+        rotated = {}
+        for leg in legs:
+            x, y, z = positions[leg]
+            rotated[leg] = (x * cos_r - y * sin_r, x * sin_r + y * cos_r, z)
+        return rotated
+
+    def _set_height(self, legs, z):
+        """Move a group of legs to height z, keeping their XY."""
+        positions = self.hex.leg_positions
+        targets = {}
+        for leg in legs:
+            x, y, _ = positions[leg]
+            targets[leg] = (x, y, z)
+        self.hex.move_legs_bulk(targets)
 
     # =========================================================================
     # Basic Movements
@@ -142,8 +365,7 @@ class GaitController:
         """Move to neutral standing position with smooth motion."""
         h = height or self.stand_height
         targets = {}
-        for leg in self.hex.leg_positions.keys():
-            x, y, _ = self.hex.leg_positions[leg]
+        for leg, (x, y, _) in self.hex.leg_positions.items():
             targets[leg] = (x, y, -h)
         self._smooth_move_legs(targets, duration=0.3 / self.speed)
 
@@ -154,13 +376,13 @@ class GaitController:
         Call periodically to prevent floating-point drift accumulation
         during extended walking sequences.
         """
-        from hexapod import LEG_ANGLES
+        stance = self._default_stance
+        z = -self.stand_height
+        targets = {}
         for leg in self.hex.leg_positions.keys():
-            # Calculate default stance position for each leg
-            angle_rad = math.radians(LEG_ANGLES[leg])
-            x = self.stance_width * math.cos(angle_rad)
-            y = self.stance_width * math.sin(angle_rad)
-            self.hex.move_leg(leg, x, y, -self.stand_height)
+            x, y = stance[leg]
+            targets[leg] = (x, y, z)
+        self.hex.move_legs_bulk(targets)
 
     def sit(self, height=20):
         """Lower body to sitting position."""
@@ -174,9 +396,7 @@ class GaitController:
             angle_offset: Positive = lower, negative = higher
         """
         base_z = -self.stand_height - angle_offset
-        for leg in self.hex.leg_positions.keys():
-            x, y, _ = self.hex.leg_positions[leg]
-            self.hex.move_leg(leg, x, y, base_z)
+        self._set_height(self.hex.leg_positions, base_z)
 
     # =========================================================================
     # Tripod Gait (Walking)
@@ -202,9 +422,7 @@ class GaitController:
             cycle_time = 0.5 / self.speed
 
         # Convert direction to x/y components
-        rad = math.radians(direction)
-        dx = step_length * math.cos(rad)
-        dy = step_length * math.sin(rad)
+        dx, dy, _, _ = _step_components(direction, step_length)
 
         half_cycle = cycle_time / 2
 
@@ -228,32 +446,25 @@ class GaitController:
             lift_height: How high to lift swing legs
             t: Time for this phase
         """
-        # Lift swing legs
-        for leg in swing_legs:
-            x, y, z = self.hex.leg_positions[leg]
-            self.hex.move_leg(leg, x, y, z + lift_height)
+        # Each phase is timed from its start, so servo writes don't
+        # stretch the gait cycle
+        phase = t / 2
+        swing, plant = _tripod_targets(self.hex.leg_positions, swing_legs,
+                                       stance_legs, dx, dy, lift_height,
+                                       -self.stand_height)
 
-        sleep(t / 3)
+        # Lift and swing forward in one diagonal move (the servos
+        # interpolate), while stance legs push back
+        deadline = _deadline(phase)
+        self.hex.move_legs_bulk(swing)
 
-        # Swing forward while stance legs push back
-        for leg in swing_legs:
-            x, y, z = self.hex.leg_positions[leg]
-            # Move forward (swing)
-            self.hex.move_leg(leg, x + dx/2, y + dy/2, z)
-
-        for leg in stance_legs:
-            x, y, z = self.hex.leg_positions[leg]
-            # Push back (propel body forward)
-            self.hex.move_leg(leg, x - dx/2, y - dy/2, z)
-
-        sleep(t / 3)
+        _sleep_until(deadline)
 
         # Lower swing legs
-        for leg in swing_legs:
-            x, y, z = self.hex.leg_positions[leg]
-            self.hex.move_leg(leg, x, y, -self.stand_height)
+        deadline = _deadline(phase)
+        self.hex.move_legs_bulk(plant)
 
-        sleep(t / 3)
+        _sleep_until(deadline)
 
     # =========================================================================
     # Rotation
@@ -270,42 +481,43 @@ class GaitController:
             cycle_time: Time for one cycle
         """
         half_cycle = cycle_time / 2
-        rad = math.radians(angle / 2)
+        rad = radians(angle / 2)
+        # Same rotation every phase - compute it once per call
+        cos_r, sin_r = cos(rad), sin(rad)
 
         for _ in range(steps):
             # Phase 1: Lift tripod 1, rotate tripod 2
-            self._rotate_tripod(self.tripod1, self.tripod2, rad,
+            self._rotate_tripod(self.tripod1, self.tripod2, cos_r, sin_r,
                               step_height, half_cycle)
 
             # Phase 2: Lift tripod 2, rotate tripod 1
-            self._rotate_tripod(self.tripod2, self.tripod1, rad,
+            self._rotate_tripod(self.tripod2, self.tripod1, cos_r, sin_r,
                               step_height, half_cycle)
 
-    def _rotate_tripod(self, swing_legs, stance_legs, rad, lift_height, t):
+    def _rotate_tripod(self, swing_legs, stance_legs, cos_r, sin_r,
+                       lift_height, t):
         """Execute rotation with one tripod lifted."""
+        positions = self.hex.leg_positions
+
         # Lift swing legs
+        lifted = {}
         for leg in swing_legs:
-            x, y, z = self.hex.leg_positions[leg]
-            self.hex.move_leg(leg, x, y, z + lift_height)
+            x, y, z = positions[leg]
+            lifted[leg] = (x, y, z + lift_height)
+        self.hex.move_legs_bulk(lifted)
 
         sleep(t / 2)
 
         # Rotate positions
-        cos_r, sin_r = math.cos(rad), math.sin(rad)
+        # Swing legs rotate in direction of turn, stance legs rotate
+        # opposite (pushes body)
+        swing = self._rotated(swing_legs, cos_r, sin_r)
+        stance = self._rotated(stance_legs, cos_r, -sin_r)
 
-        for leg in swing_legs:
-            x, y, z = self.hex.leg_positions[leg]
-            # Rotate swing legs in direction of turn
-            new_x = x * cos_r - y * sin_r
-            new_y = x * sin_r + y * cos_r
-            self.hex.move_leg(leg, new_x, new_y, -self.stand_height)
-
-        for leg in stance_legs:
-            x, y, z = self.hex.leg_positions[leg]
-            # Rotate stance legs opposite (pushes body)
-            new_x = x * cos_r + y * sin_r
-            new_y = -x * sin_r + y * cos_r
-            self.hex.move_leg(leg, new_x, new_y, z)
+        plant_z = -self.stand_height
+        for leg, (x, y, _) in swing.items():
+            stance[leg] = (x, y, plant_z)
+        self.hex.move_legs_bulk(stance)
 
         sleep(t / 2)
 
@@ -319,15 +531,9 @@ class GaitController:
         back_z = -self.stand_height + angle
         mid_z = -self.stand_height
 
-        for leg in self.front_legs:
-            x, y, _ = self.hex.leg_positions[leg]
-            self.hex.move_leg(leg, x, y, front_z)
-        for leg in self.middle_legs:
-            x, y, _ = self.hex.leg_positions[leg]
-            self.hex.move_leg(leg, x, y, mid_z)
-        for leg in self.back_legs:
-            x, y, _ = self.hex.leg_positions[leg]
-            self.hex.move_leg(leg, x, y, back_z)
+        self._set_height(self.front_legs, front_z)
+        self._set_height(self.middle_legs, mid_z)
+        self._set_height(self.back_legs, back_z)
 
     def tilt_back(self, angle=20):
         """Tilt body backward (front up, back down)."""
@@ -338,12 +544,8 @@ class GaitController:
         left_z = -self.stand_height - angle
         right_z = -self.stand_height + angle
 
-        for leg in self.left_legs:
-            x, y, _ = self.hex.leg_positions[leg]
-            self.hex.move_leg(leg, x, y, left_z)
-        for leg in self.right_legs:
-            x, y, _ = self.hex.leg_positions[leg]
-            self.hex.move_leg(leg, x, y, right_z)
+        self._set_height(self.left_legs, left_z)
+        self._set_height(self.right_legs, right_z)
 
     def tilt_right(self, angle=20):
         """Tilt body right (right side down)."""
@@ -356,14 +558,11 @@ class GaitController:
         Args:
             angle: Twist angle in degrees (positive=CCW)
         """
-        rad = math.radians(angle)
-        cos_r, sin_r = math.cos(rad), math.sin(rad)
+        rad = radians(angle)
+        cos_r, sin_r = cos(rad), sin(rad)
 
-        for leg in self.hex.leg_positions.keys():
-            x, y, z = self.hex.leg_positions[leg]
-            new_x = x * cos_r - y * sin_r
-            new_y = x * sin_r + y * cos_r
-            self.hex.move_leg(leg, new_x, new_y, z)
+        targets = self._rotated(list(self.hex.leg_positions), cos_r, sin_r)
+        self.hex.move_legs_bulk(targets)
 
     # =========================================================================
     # Wave Gait (slower but more stable)
@@ -389,29 +588,24 @@ class GaitController:
         # Scale timing by speed
         if leg_time is None:
             leg_time = 0.2 / self.speed
-        rad = math.radians(direction)
-        dx = step_length * math.cos(rad)
-        dy = step_length * math.sin(rad)
-
         # Wave sequence: R3, R2, R1, L3, L2, L1
         sequence = ['R3', 'R2', 'R1', 'L3', 'L2', 'L1']
 
         # Each leg moves forward by step_length over the full cycle
         # Stance legs push back incrementally (1/6 of step per leg movement)
-        push_dx = dx / 6
-        push_dy = dy / 6
+        dx, dy, push_dx, push_dy = _step_components(direction, step_length)
 
-        for _ in range(steps):
-            for leg in sequence:
-                # Get all other legs (stance legs)
-                stance_legs = [l for l in sequence if l != leg]
+        # Stance legs (all the others) for each swing leg, built once
+        groups = _stance_groups(sequence)
 
+        for _ in range(steps):
+            for leg, stance_legs in groups:
                 # Move swing leg forward while stance legs push back
                 self._single_leg_step(leg, dx, dy, step_height, leg_time,
                                      stance_legs, push_dx, push_dy)
 
     def _single_leg_step(self, leg, dx, dy, lift_height, t,
-                         stance_legs=None, push_dx=0, push_dy=0):
+                         stance_legs=(), push_dx=0, push_dy=0):
         """
         Move single leg forward while stance legs push back.
 
@@ -424,30 +618,31 @@ class GaitController:
             push_dx, push_dy: How much stance legs push back
         """
         x, y, z = self.hex.leg_positions[leg]
+        phase = t / 3
 
         # Phase 1: Lift swing leg
+        deadline = _deadline(phase)
         self.hex.move_leg(leg, x, y, z + lift_height)
-        sleep(t / 3)
+        _sleep_until(deadline)
 
         # Phase 2: Swing leg forward, stance legs push back (moves body forward)
-        self.hex.move_leg(leg, x + dx, y + dy, z + lift_height)
+        deadline = _deadline(phase)
+        targets = _shifted(self.hex.leg_positions, stance_legs,
+                           -push_dx, -push_dy)
+        targets[leg] = (x + dx, y + dy, z + lift_height)
+        self.hex.move_legs_bulk(targets)
 
-        if stance_legs:
-            for stance_leg in stance_legs:
-                sx, sy, sz = self.hex.leg_positions[stance_leg]
-                self.hex.move_leg(stance_leg, sx - push_dx, sy - push_dy, sz)
-
-        sleep(t / 3)
+        _sleep_until(deadline)
 
         # Phase 3: Plant swing leg
+        deadline = _deadline(phase)
         self.hex.move_leg(leg, x + dx, y + dy, -self.stand_height)
-        sleep(t / 3)
+        _sleep_until(deadline)
 
     def _shift_all_legs(self, dx, dy, t):
         """Shift all legs (body moves opposite direction)."""
-        for leg in self.hex.leg_positions.keys():
-            x, y, z = self.hex.leg_positions[leg]
-            self.hex.move_leg(leg, x + dx, y + dy, z)
+        self.hex.move_legs_bulk(_shifted(self.hex.leg_positions,
+                                         list(self.hex.leg_positions), dx, dy))
         sleep(t)
 
     # =========================================================================
@@ -459,8 +654,8 @@ class GaitController:
         Startup sequence - unfold from curled position.
         Ported from hexy boot_up().
         """
-        # Start curled
-        self._curl_up()
+        # Start curled (always sent - servos may be unpowered at boot)
+        self._curl_up(force=True)
         sleep(t)
 
         # Flatten out
@@ -486,32 +681,54 @@ class GaitController:
         # Disable servos
         self.hex.shutdown()
 
-    def _curl_up(self):
-        """Curl all legs inward (compact storage position)."""
-        for leg in self.hex.leg_positions.keys():
-            # Tuck legs under body
-            self.hex.move_leg(leg, 30, 0, -20)
+    def _curl_up(self, force=False):
+        """
+        Curl all legs inward (compact storage position).
+
+        Args:
+            force: Send every leg even if its tracked position is curled
+        """
+        # Tuck legs under body (skipping any already tucked)
+        positions = self.hex.leg_positions
+        targets = {leg: (30, 0, -20) for leg in positions}
+        if not force:
+            targets = _pending(positions, targets)
+        if targets:
+            self.hex.move_legs_bulk(targets)
 
     def _lie_flat(self):
         """Extend legs flat on ground."""
-        for leg in self.hex.leg_positions.keys():
-            self.hex.move_leg(leg, self.stance_width, 0, -10)
+        positions = self.hex.leg_positions
+        targets = _pending(positions, {leg: (self.stance_width, 0, -10)
+                                       for leg in positions})
+        if targets:
+            self.hex.move_legs_bulk(targets)
 
     def _get_up(self):
         """Rise from lying flat to standing."""
-        for height in range(10, self.stand_height + 1, 10):
-            for leg in self.hex.leg_positions.keys():
-                x, y, _ = self.hex.leg_positions[leg]
-                self.hex.move_leg(leg, x, y, -height)
-            sleep(0.1)
+        self._ramp_height(range(10, self.stand_height + 1, 10))
 
     def _lie_down(self):
         """Lower from standing to lying flat."""
-        for height in range(self.stand_height, 9, -10):
-            for leg in self.hex.leg_positions.keys():
-                x, y, _ = self.hex.leg_positions[leg]
-                self.hex.move_leg(leg, x, y, -height)
-            sleep(0.1)
+        self._ramp_height(range(self.stand_height, 9, -10))
+
+    def _ramp_height(self, heights, t=0.1):
+        """
+        Step all legs through a series of heights, keeping their XY.
+
+        Args:
+            heights: Heights below coxa (mm), in order
+            t: Time per height step
+        """
+        # XY doesn't change during the ramp - snapshot it once
+        feet = [(leg, x, y) for leg, (x, y, _) in self.hex.leg_positions.items()]
+        move_legs_bulk = self.hex.move_legs_bulk
+
+        for height in heights:
+            deadline = _deadline(t)
+            z = -height
+            move_legs_bulk({leg: (x, y, z) for leg, x, y in feet})
+            _sleep_until(deadline)
 
 
 class RippleGait:
@@ -541,41 +758,39 @@ class RippleGait:
         if phase_time is None:
             phase_time = 0.12 / self.speed
 
-        rad = math.radians(direction)
-        dx = step_length * math.cos(rad)
-        dy = step_length * math.sin(rad)
-
         # Shift amount for stance legs (1/6 of step per leg)
-        shift_dx = dx / 6
-        shift_dy = dy / 6
+        dx, dy, shift_dx, shift_dy = _step_components(direction, step_length)
+
+        # Stance legs (all the others) for each swing leg, built once
+        groups = _stance_groups(self.sequence)
+        move_legs_bulk = self.hex.move_legs_bulk
 
         for _ in range(steps):
-            for i, leg in enumerate(self.sequence):
+            for leg, stance_legs in groups:
                 # Capture all stance leg positions BEFORE modifying any
                 # This prevents concurrent modification issues
-                stance_positions = {}
-                for other in self.sequence:
-                    if other != leg:
-                        stance_positions[other] = self.hex.leg_positions[other]
+                stance = _shifted(self.hex.leg_positions, stance_legs,
+                                  -shift_dx, -shift_dy)
 
                 # Move swing leg
                 self._step_leg(leg, dx, dy, step_height, phase_time)
 
                 # Shift all stance legs using the captured positions
-                for other, (x, y, z) in stance_positions.items():
-                    self.hex.move_leg(other, x - shift_dx, y - shift_dy, z)
+                move_legs_bulk(stance)
 
     def _step_leg(self, leg, dx, dy, lift, t):
         """Single leg step in ripple pattern."""
         x, y, z = self.hex.leg_positions[leg]
 
         # Lift and swing
+        deadline = _deadline(t)
         self.hex.move_leg(leg, x + dx, y + dy, z + lift)
-        sleep(t)
+        _sleep_until(deadline)
 
         # Plant
+        deadline = _deadline(t / 2)
         self.hex.move_leg(leg, x + dx, y + dy, -self.stand_height)
-        sleep(t / 2)
+        _sleep_until(deadline)
 
 
 if __name__ == '__main__':
@@ -214,6 +214,11 @@ class Hexapod:
 
     def set_servo(self, leg, joint, angle):
         """Set single servo to angle (0-180 degrees)."""
+        self._stage_servo(leg, joint, angle)
+        self._flush()
+
+    def _stage_servo(self, leg, joint, angle):
+        """Stage servo angle in its PCA9685 register image (sent by _flush)."""
         pca_idx, channel = self.servo_map[leg][joint]
         direction = self.servo_dir[leg][joint]
 
@@ -227,18 +232,45 @@ class Hexapod:
             # Just track the position
             pass
         else:
-            self.pca[pca_idx].set_pwm(channel, pulse)
+            self.pca[pca_idx].stage_pwm(channel, pulse)
 
-    def move_leg(self, leg, x, y, z):
-        """Move single leg to position using IK."""
+    def _flush(self):
+        """Send staged servo updates, one I2C burst per PCA9685."""
+        if self.simulate:
+            return
+        for pca in self.pca:
+            if pca:
+                pca.flush()
+
+    def _stage_leg(self, leg, x, y, z):
+        """Solve IK for one leg and stage its three servos."""
         coxa, femur, tibia = leg_ik(x, y, z)
 
-        self.set_servo(leg, 'coxa', coxa)
-        self.set_servo(leg, 'femur', femur)
-        self.set_servo(leg, 'tibia', tibia)
+        self._stage_servo(leg, 'coxa', coxa)
+        self._stage_servo(leg, 'femur', femur)
+        self._stage_servo(leg, 'tibia', tibia)
 
         self.leg_positions[leg] = (x, y, z)
 
+    def move_leg(self, leg, x, y, z):
+        """Move single leg to position using IK."""
+        self._stage_leg(leg, x, y, z)
+        self._flush()
+
+    def move_legs_bulk(self, targets):
+        """
+        Move several legs together using IK.
+
+        All servos are staged first and sent in one I2C burst per
+        PCA9685, so the legs start moving at the same time.
+
+        Args:
+            targets: Dict of {leg_name: (x, y, z)}
+        """
+        for leg, (x, y, z) in targets.items():
+            self._stage_leg(leg, x, y, z)
+        self._flush()
+
     def stand(self, height=50):
         """
         Move to standing position.
@@ -264,7 +296,8 @@ class Hexapod:
         """Move all servos to 90 degrees (calibration position)."""
         for leg in self.servo_map.keys():
             for joint in ['coxa', 'femur', 'tibia']:
-                self.set_servo(leg, joint, 90)
+                self._stage_servo(leg, joint, 90)
+        self._flush()
 
     def shutdown(self):
         """Disable all servos (no holding torque)."""
@@ -276,7 +309,8 @@ class Hexapod:
             for joint in self.servo_map[leg]:
                 pca_idx, channel = self.servo_map[leg][joint]
                 if self.pca[pca_idx]:
-                    self.pca[pca_idx].set_pwm(channel, 0)
+                    self.pca[pca_idx].stage_pwm(channel, 0)
+        self._flush()
 
     def get_leg_position(self, leg):
         """Get current (x, y, z) position of leg."""
@@ -5,7 +5,6 @@ Provides voltage, current, and power measurements for battery monitoring.
 Default I2C Address: 0x40 (conflicts with PCA9685, use 0x44 with A0+A1 jumpers)
 """
 
-import struct
 import time
 
 # Registers
@@ -32,46 +31,60 @@ CONFIG_BADC_12BIT = 0x0180    # 12-bit, 532us
 CONFIG_SADC_12BIT = 0x0018    # 12-bit, 532us
 
 # Operating mode
-CONFIG_MODE_CONTINUOUS = 0x0007
+CONFIG_MODE_CONTINUOUS = 0x0007  # Shunt and bus, continuous
+CONFIG_MODE_TRIGGERED = 0x0003   # Shunt and bus, one conversion per write
+
+# Max wait for a triggered conversion (two 12-bit conversions ~1.1ms)
+CONVERSION_TIMEOUT_MS = 5
 
 
 class INA219:
     """INA219 current/power monitor driver."""
 
-    def __init__(self, i2c, address=0x44, shunt_ohms=0.1, max_amps=3.2):
+    def __init__(self, i2c, address=0x44, shunt_ohms=0.1, max_amps=3.2,
+                 continuous=True):
         """
         Args:
             i2c: I2C bus instance
             address: I2C address (default 0x44 to avoid PCA9685 conflict)
             shunt_ohms: Shunt resistor value in ohms (default 0.1)
             max_amps: Maximum expected current in amps (default 3.2A)
+            continuous: Convert continuously (True) or only when sample()
+                is called (False - for slow polling, idles the ADC)
         """
         self.i2c = i2c
         self.address = address
         self.shunt_ohms = shunt_ohms
         self.max_amps = max_amps
+        self.continuous = continuous
 
         # Calibration values (calculated in configure)
         self.current_lsb = 0
         self.power_lsb = 0
         self.cal_value = 0
 
+        # Register buffer, reused for every 16-bit read/write
+        self._buf = bytearray(2)
+
         self._init_device()
 
     def _write_register(self, reg, value):
         """Write 16-bit value to register."""
-        data = struct.pack('>H', value)
-        self.i2c.writeto_mem(self.address, reg, data)
+        buf = self._buf
+        buf[0] = (value >> 8) & 0xFF
+        buf[1] = value & 0xFF
+        self.i2c.writeto_mem(self.address, reg, buf)
 
     def _read_register(self, reg):
         """Read 16-bit value from register."""
-        data = self.i2c.readfrom_mem(self.address, reg, 2)
-        return struct.unpack('>H', data)[0]
+        buf = self._buf
+        self.i2c.readfrom_mem_into(self.address, reg, buf)
+        return (buf[0] << 8) | buf[1]
 
     def _read_register_signed(self, reg):
         """Read 16-bit signed value from register."""
-        data = self.i2c.readfrom_mem(self.address, reg, 2)
-        return struct.unpack('>h', data)[0]
+        value = self._read_register(reg)
+        return value - 0x10000 if value & 0x8000 else value
 
     def _init_device(self):
         """Initialize and configure the INA219."""
@@ -83,8 +96,12 @@ class INA219:
         config = (CONFIG_BVOLT_RANGE_32V |
                   CONFIG_GAIN_8_320MV |
                   CONFIG_BADC_12BIT |
-                  CONFIG_SADC_12BIT |
-                  CONFIG_MODE_CONTINUOUS)
+                  CONFIG_SADC_12BIT)
+        if self.continuous:
+            config |= CONFIG_MODE_CONTINUOUS
+        else:
+            config |= CONFIG_MODE_TRIGGERED
+        self._config = config
         self._write_register(REG_CONFIG, config)
 
         # Calculate and set calibration
@@ -146,13 +163,37 @@ class INA219:
         raw = self._read_register(REG_POWER)
         return raw * self.power_lsb
 
+    def sample(self):
+        """
+        Trigger one conversion and wait for it (triggered mode).
+
+        No-op in continuous mode, where results are always fresh.
+
+        Returns:
+            bool: True if new results are ready, False on timeout
+        """
+        if self.continuous:
+            return True
+
+        # Rewriting the config starts a new conversion
+        self._write_register(REG_CONFIG, self._config)
+        start = time.ticks_ms()
+        while not self.is_conversion_ready():
+            if time.ticks_diff(time.ticks_ms(), start) > CONVERSION_TIMEOUT_MS:
+                return False
+        return True
+
     def read_all(self):
         """
-        Read all measurements.
+        Read all measurements (triggering a conversion first if needed).
+
+        One transaction per register - the INA219 register pointer does
+        not auto-increment, so 0x01-0x04 can't be burst-read.
 
         Returns:
             dict with keys: voltage, current, power, shunt_voltage
         """
+        self.sample()
         return {
             'voltage': self.read_voltage(),
             'current': self.read_current(),
@@ -192,8 +233,12 @@ class BatteryMonitor:
         self.max_voltage = cell_max_v * cell_count
         self.warn_voltage = (cell_min_v + 0.2) * cell_count  # 3.2V/cell warning
 
+        # SOC percent per volt above empty, for get_soc_percent()
+        self._soc_scale = 100.0 / (self.max_voltage - self.min_voltage)
+
     def get_voltage(self):
-        """Get battery voltage."""
+        """Get battery voltage (starts a fresh conversion if triggered)."""
+        self.ina.sample()
         return self.ina.read_voltage()
 
     def get_current(self):
@@ -204,24 +249,41 @@ class BatteryMonitor:
         """Get power consumption in watts."""
         return self.ina.read_power()
 
-    def get_soc_percent(self):
+    def get_soc_percent(self, voltage=None):
         """
         Estimate state of charge percentage.
 
         Simple linear interpolation based on voltage.
         Not accurate under load - best measured at rest.
 
+        Args:
+            voltage: Battery voltage already read (None = read INA219)
+
         Returns:
             float: Estimated SOC (0-100%)
         """
-        voltage = self.get_voltage()
-        if voltage >= self.max_voltage:
-            return 100.0
-        if voltage <= self.min_voltage:
-            return 0.0
+        if voltage is None:
+            voltage = self.get_voltage()
+        soc = (voltage - self.min_voltage) * self._soc_scale
+        return max(0.0, min(100.0, soc))
+
+    def get_level(self, voltage=None):
+        """
+        Classify battery voltage.
+
+        Args:
+            voltage: Battery voltage already read (None = read INA219)
 
-        return ((voltage - self.min_voltage) /
-                (self.max_voltage - self.min_voltage)) * 100
+        Returns:
+            str: 'critical', 'low', or 'ok'
+        """
+        if voltage is None:
+            voltage = self.get_voltage()
+        if voltage < self.min_voltage:
+            return 'critical'
+        if voltage < self.warn_voltage:
+            return 'low'
+        return 'ok'
 
     def is_low_battery(self):
         """Check if battery is low (below warning threshold)."""
@@ -240,20 +302,12 @@ class BatteryMonitor:
         """
         voltage = self.get_voltage()
         current = self.get_current()
-        power = self.get_power()
-        soc = self.get_soc_percent()
-
-        if voltage < self.min_voltage:
-            status = 'critical'
-        elif voltage < self.warn_voltage:
-            status = 'low'
-        else:
-            status = 'ok'
 
+        # P = V * I locally instead of a third I2C read of REG_POWER
         return {
             'voltage': voltage,
             'current': current,
-            'power': power,
-            'soc_percent': soc,
-            'status': status,
+            'power': voltage * current,
+            'soc_percent': self.get_soc_percent(voltage),
+            'status': self.get_level(voltage),
         }
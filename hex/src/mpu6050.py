@@ -7,6 +7,9 @@ I2C Address: 0x68 (default) or 0x69 (AD0 high)
 
 import struct
 import time
+import micropython
+from array import array
+from math import atan2, sqrt, degrees
 
 # Registers
 PWR_MGMT_1 = 0x6B
@@ -14,6 +17,9 @@ SMPLRT_DIV = 0x19
 CONFIG = 0x1A
 GYRO_CONFIG = 0x1B
 ACCEL_CONFIG = 0x1C
+INT_PIN_CFG = 0x37
+INT_ENABLE = 0x38
+INT_STATUS = 0x3A
 ACCEL_XOUT_H = 0x3B
 TEMP_OUT_H = 0x41
 GYRO_XOUT_H = 0x43
@@ -23,6 +29,19 @@ WHO_AM_I = 0x75
 ACCEL_SCALE = {0: 16384, 1: 8192, 2: 4096, 3: 2048}  # LSB/g
 GYRO_SCALE = {0: 131, 1: 65.5, 2: 32.8, 3: 16.4}     # LSB/(deg/s)
 
+_RAD2DEG = 57.29577951308232
+
+# Power-up configuration, written back-to-back by _init_device() with a
+# single settle at the end (register, 1-byte value)
+_INIT_SEQ = (
+    (PWR_MGMT_1, b'\x00'),    # Wake up (clear sleep bit)
+    (SMPLRT_DIV, b'\x04'),    # Sample rate 1kHz / (1 + 4) = 200Hz
+    (CONFIG, b'\x03'),        # DLPF ~44Hz
+    (ACCEL_CONFIG, b'\x00'),  # Accelerometer +/- 2g
+    (GYRO_CONFIG, b'\x00'),   # Gyroscope +/- 250 deg/s
+)
+INIT_SETTLE_MS = 100
+
 
 class MPU6050:
     """MPU6050 6-axis IMU driver."""
@@ -37,24 +56,33 @@ class MPU6050:
         self.address = address
         self.accel_scale = ACCEL_SCALE[0]
         self.gyro_scale = GYRO_SCALE[0]
+        self._accel_inv = 1.0 / self.accel_scale
+        self._gyro_inv = 1.0 / self.gyro_scale
 
         # Calibration offsets
         self.accel_offset = [0, 0, 0]
         self.gyro_offset = [0, 0, 0]
 
+        # Burst read buffer: accel(6) + temp(2) + gyro(6)
+        self._raw_buf = bytearray(14)
+        self._temp_buf = bytearray(2)
+        self._byte_buf = bytearray(1)
+
+        # Scaled sample for read(): ax, ay, az, gx, gy, gz
+        self._sample = array('f', (0.0,) * 6)
+
         self._init_device()
 
     def _write_byte(self, reg, value):
         """Write single byte to register."""
-        self.i2c.writeto_mem(self.address, reg, bytes([value]))
+        buf = self._byte_buf
+        buf[0] = value
+        self.i2c.writeto_mem(self.address, reg, buf)
 
     def _read_byte(self, reg):
         """Read single byte from register."""
-        return self.i2c.readfrom_mem(self.address, reg, 1)[0]
-
-    def _read_bytes(self, reg, length):
-        """Read multiple bytes from register."""
-        return self.i2c.readfrom_mem(self.address, reg, length)
+        self.i2c.readfrom_mem_into(self.address, reg, self._byte_buf)
+        return self._byte_buf[0]
 
     def _init_device(self):
         """Initialize the MPU6050."""
@@ -63,23 +91,41 @@ class MPU6050:
         if who != 0x68:
             print(f"Warning: MPU6050 WHO_AM_I = 0x{who:02X}, expected 0x68")
 
-        # Wake up (clear sleep bit)
-        self._write_byte(PWR_MGMT_1, 0x00)
-        time.sleep(0.1)
+        # Wake and configure - the config registers accept writes right
+        # after the sleep bit clears, so only one settle is needed
+        write = self.i2c.writeto_mem
+        address = self.address
+        for reg, value in _INIT_SEQ:
+            write(address, reg, value)
+        time.sleep_ms(INIT_SETTLE_MS)
 
-        # Set sample rate divider (1kHz / (1 + 4) = 200Hz)
-        self._write_byte(SMPLRT_DIV, 4)
+        self.accel_scale = ACCEL_SCALE[0]
+        self._accel_inv = 1.0 / self.accel_scale
+        self.gyro_scale = GYRO_SCALE[0]
+        self._gyro_inv = 1.0 / self.gyro_scale
 
-        # Set DLPF (Digital Low Pass Filter) to ~44Hz
-        self._write_byte(CONFIG, 3)
+    def set_sample_rate(self, rate_hz):
+        """
+        Set output data rate (DLPF enabled, 1kHz internal rate).
 
-        # Set accelerometer range to +/- 2g
-        self._write_byte(ACCEL_CONFIG, 0x00)
-        self.accel_scale = ACCEL_SCALE[0]
+        Args:
+            rate_hz: 4-1000 Hz
+        """
+        div = max(0, min(255, int(1000 / rate_hz) - 1))
+        self._write_byte(SMPLRT_DIV, div)
 
-        # Set gyroscope range to +/- 250 deg/s
-        self._write_byte(GYRO_CONFIG, 0x00)
-        self.gyro_scale = GYRO_SCALE[0]
+    def enable_data_ready_interrupt(self):
+        """
+        Pulse the INT pin (active high, push-pull) on each new sample.
+
+        Any register read clears the interrupt status.
+        """
+        self._write_byte(INT_PIN_CFG, 0x10)  # INT_RD_CLEAR
+        self._write_byte(INT_ENABLE, 0x01)   # DATA_RDY_EN
+
+    def disable_interrupts(self):
+        """Disable all interrupt sources."""
+        self._write_byte(INT_ENABLE, 0x00)
 
     def set_accel_range(self, range_g):
         """
@@ -94,6 +140,7 @@ class MPU6050:
         idx = ranges[range_g]
         self._write_byte(ACCEL_CONFIG, idx << 3)
         self.accel_scale = ACCEL_SCALE[idx]
+        self._accel_inv = 1.0 / self.accel_scale
 
     def set_gyro_range(self, range_dps):
         """
@@ -108,7 +155,9 @@ class MPU6050:
         idx = ranges[range_dps]
         self._write_byte(GYRO_CONFIG, idx << 3)
         self.gyro_scale = GYRO_SCALE[idx]
+        self._gyro_inv = 1.0 / self.gyro_scale
 
+    @micropython.native
     def read_raw(self):
         """
         Read raw sensor data.
@@ -116,19 +165,40 @@ class MPU6050:
         Returns:
             tuple: (ax, ay, az, gx, gy, gz) raw values
         """
-        # Read 14 bytes: accel(6) + temp(2) + gyro(6)
-        data = self._read_bytes(ACCEL_XOUT_H, 14)
+        # Single 14-byte burst: ACCEL_XOUT_H..GYRO_ZOUT_L
+        self.i2c.readfrom_mem_into(self.address, ACCEL_XOUT_H, self._raw_buf)
 
-        # Unpack as big-endian signed shorts
-        ax = struct.unpack('>h', data[0:2])[0]
-        ay = struct.unpack('>h', data[2:4])[0]
-        az = struct.unpack('>h', data[4:6])[0]
-        gx = struct.unpack('>h', data[8:10])[0]
-        gy = struct.unpack('>h', data[10:12])[0]
-        gz = struct.unpack('>h', data[12:14])[0]
+        # Unpack as big-endian signed shorts (temperature discarded)
+        ax, ay, az, _, gx, gy, gz = struct.unpack_from('>hhhhhhh', self._raw_buf, 0)
 
         return ax, ay, az, gx, gy, gz
 
+    @micropython.native
+    def read_into(self, buf):
+        """
+        Read calibrated sensor data into a caller-owned buffer.
+
+        Nothing is allocated, so this suits per-sample control loops.
+
+        Args:
+            buf: array('f') of length 6, filled with ax, ay, az in g
+                and gx, gy, gz in deg/s
+        """
+        ax, ay, az, gx, gy, gz = self.read_raw()
+
+        # Apply calibration offsets and convert to physical units
+        # (multiply by cached 1/scale)
+        accel_inv = self._accel_inv
+        gyro_inv = self._gyro_inv
+        offset = self.accel_offset
+        buf[0] = (ax - offset[0]) * accel_inv
+        buf[1] = (ay - offset[1]) * accel_inv
+        buf[2] = (az - offset[2]) * accel_inv
+        offset = self.gyro_offset
+        buf[3] = (gx - offset[0]) * gyro_inv
+        buf[4] = (gy - offset[1]) * gyro_inv
+        buf[5] = (gz - offset[2]) * gyro_inv
+
     def read(self):
         """
         Read calibrated sensor data.
@@ -138,28 +208,11 @@ class MPU6050:
                 accel: (ax, ay, az) in g
                 gyro: (gx, gy, gz) in deg/s
         """
-        ax, ay, az, gx, gy, gz = self.read_raw()
-
-        # Apply calibration offsets
-        ax -= self.accel_offset[0]
-        ay -= self.accel_offset[1]
-        az -= self.accel_offset[2]
-        gx -= self.gyro_offset[0]
-        gy -= self.gyro_offset[1]
-        gz -= self.gyro_offset[2]
-
-        # Convert to physical units
+        s = self._sample
+        self.read_into(s)
         return {
-            'accel': (
-                ax / self.accel_scale,
-                ay / self.accel_scale,
-                az / self.accel_scale,
-            ),
-            'gyro': (
-                gx / self.gyro_scale,
-                gy / self.gyro_scale,
-                gz / self.gyro_scale,
-            ),
+            'accel': (s[0], s[1], s[2]),
+            'gyro': (s[3], s[4], s[5]),
         }
 
     def read_temperature(self):
@@ -169,8 +222,8 @@ class MPU6050:
         Returns:
             float: Temperature in degrees C
         """
-        data = self._read_bytes(TEMP_OUT_H, 2)
-        raw = struct.unpack('>h', data)[0]
+        self.i2c.readfrom_mem_into(self.address, TEMP_OUT_H, self._temp_buf)
+        raw = struct.unpack_from('>h', self._temp_buf, 0)[0]
         return (raw / 340.0) + 36.53
 
     def calibrate(self, samples=100, delay_ms=10):
@@ -186,48 +239,102 @@ class MPU6050:
         """
         print("Calibrating MPU6050 (keep device still and level)...")
 
-        accel_sum = [0, 0, 0]
-        gyro_sum = [0, 0, 0]
+        ax_sum = ay_sum = az_sum = 0
+        gx_sum = gy_sum = gz_sum = 0
 
         for _ in range(samples):
             ax, ay, az, gx, gy, gz = self.read_raw()
-            accel_sum[0] += ax
-            accel_sum[1] += ay
-            accel_sum[2] += az
-            gyro_sum[0] += gx
-            gyro_sum[1] += gy
-            gyro_sum[2] += gz
-            time.sleep(delay_ms / 1000)
+            ax_sum += ax
+            ay_sum += ay
+            az_sum += az
+            gx_sum += gx
+            gy_sum += gy
+            gz_sum += gz
+            time.sleep_ms(delay_ms)
 
         # Average
-        self.accel_offset[0] = accel_sum[0] // samples
-        self.accel_offset[1] = accel_sum[1] // samples
+        self.accel_offset[0] = ax_sum // samples
+        self.accel_offset[1] = ay_sum // samples
         # Z should read 1g, so offset = reading - 1g
-        self.accel_offset[2] = (accel_sum[2] // samples) - self.accel_scale
+        self.accel_offset[2] = (az_sum // samples) - self.accel_scale
 
-        self.gyro_offset[0] = gyro_sum[0] // samples
-        self.gyro_offset[1] = gyro_sum[1] // samples
-        self.gyro_offset[2] = gyro_sum[2] // samples
+        self.gyro_offset[0] = gx_sum // samples
+        self.gyro_offset[1] = gy_sum // samples
+        self.gyro_offset[2] = gz_sum // samples
 
         print(f"Accel offsets: {self.accel_offset}")
         print(f"Gyro offsets: {self.gyro_offset}")
 
-    def get_roll_pitch(self):
+    @micropython.native
+    @micropython.native
+    def read_accel(self):
         """
-        Calculate roll and pitch angles from accelerometer.
+        Read offset-corrected accelerometer counts (one 14-byte burst).
 
         Returns:
-            tuple: (roll, pitch) in degrees
+            tuple: (ax, ay, az) raw counts
         """
-        import math
+        ax, ay, az, _, _, _ = self.read_raw()
+        offset = self.accel_offset
+        return ax - offset[0], ay - offset[1], az - offset[2]
 
-        data = self.read()
-        ax, ay, az = data['accel']
+    def roll_pitch(self, ax, ay, az):
+        """
+        Calculate roll and pitch from read_accel() counts.
+
+        atan2 is scale-invariant, so no unit conversion is needed.
 
+        Returns:
+            tuple: (roll, pitch) in degrees
+        """
         # Roll: rotation around X axis
-        roll = math.degrees(math.atan2(ay, az))
+        roll = degrees(atan2(ay, az))
 
         # Pitch: rotation around Y axis
-        pitch = math.degrees(math.atan2(-ax, math.sqrt(ay*ay + az*az)))
+        pitch = degrees(atan2(-ax, sqrt(ay*ay + az*az)))
+
+        return roll, pitch
+
+    @micropython.native
+    def roll_pitch_fast(self, ax, ay, az, az_threshold=0.9):
+        """
+        Roll and pitch from read_accel() counts, small-angle when near level.
+
+        While Z still carries more than az_threshold g, atan(a/az) ~ a/az
+        and the atan2/sqrt calls are skipped (error grows with tilt: about
+        0.8 degrees at 20 degrees). Otherwise this falls back to the exact
+        roll_pitch() math.
+
+        Args:
+            az_threshold: Minimum Z acceleration (g) for the fast path
+
+        Returns:
+            tuple: (roll, pitch) in degrees
+        """
+        if az > az_threshold * self.accel_scale:
+            k = _RAD2DEG / az
+            return ay * k, -ax * k
 
+        roll = degrees(atan2(ay, az))
+        pitch = degrees(atan2(-ax, sqrt(ay*ay + az*az)))
         return roll, pitch
+
+    def get_roll_pitch(self):
+        """
+        Calculate roll and pitch angles from accelerometer.
+
+        Returns:
+            tuple: (roll, pitch) in degrees
+        """
+        ax, ay, az = self.read_accel()
+        return self.roll_pitch(ax, ay, az)
+
+    def get_roll_pitch_fast(self, az_threshold=0.9):
+        """
+        Read the IMU and return roll_pitch_fast() angles.
+
+        Returns:
+            tuple: (roll, pitch) in degrees
+        """
+        ax, ay, az = self.read_accel()
+        return self.roll_pitch_fast(ax, ay, az, az_threshold)
@@ -31,9 +31,37 @@ LED0_ON_H = 0x07
 LED0_OFF_L = 0x08
 LED0_OFF_H = 0x09
 
+# LEDn_ON_L register for each channel
+_CH_REGS = tuple(LED0_ON_L + 4 * c for c in range(16))
+
+# 1/180, for degrees -> fraction of servo range
+_PER_DEGREE = 1.0 / 180.0
+
+# set_all_pwm() argument for disable_all()
+_ALL_OFF = (0,) * 16
+
 # I2C retry settings
 I2C_RETRIES = 3
-I2C_RETRY_DELAY = 0.01  # 10ms between retries
+I2C_RETRY_DELAY_US = 200  # First retry delay, doubled for each retry
+
+# _retry() result when every attempt failed
+_FAILED = object()
+
+try:
+    _sleep_us = time.sleep_us
+except AttributeError:
+    # CPython
+    def _sleep_us(us):
+        time.sleep(us / 1000000)
+
+
+def _sim_write(address, reg, data):
+    """Simulation-mode bus write (does nothing)."""
+
+
+def _sim_read(address, reg):
+    """Simulation-mode bus read."""
+    return 0
 
 
 class I2CError(Exception):
@@ -56,13 +84,31 @@ class PCA9685:
         """
         self.address = address
         self.freq = freq
+        self._counts_per_us = 4096.0 * freq / 1000000.0
         self.simulate = simulate or (smbus2 is None and not MICROPYTHON)
         self.on_error = on_error
         self._error_count = 0
 
+        # Register image of LED0..LED15 (ON_L, ON_H, OFF_L, OFF_H) for burst
+        # writes, plus the range of channels staged since the last flush
+        self._frame = bytearray(64)
+        for i in range(3, 64, 4):
+            self._frame[i] = 0x10  # Full off until set (matches power-on state)
+        self._frame_mv = memoryview(self._frame)
+        self._dirty_lo = 16
+        self._dirty_hi = -1
+
+        # Single-byte register access (MicroPython), reused per call
+        self._byte_buf = bytearray(1)
+
+        # Last value written to MODE1 - this driver owns the register,
+        # so set_frequency() doesn't need to read it back
+        self._mode1 = 0x00
+
         if self.simulate:
             print(f"PCA9685 @ 0x{address:02X}: Simulation mode")
             self._pwm_values = [0] * 16
+            self._bind_bus()
             return
 
         if MICROPYTHON:
@@ -72,12 +118,46 @@ class PCA9685:
             bus_num = i2c if isinstance(i2c, int) else 1
             self.bus = smbus2.SMBus(bus_num)
 
+        self._bind_bus()
         self._init_device()
 
-    def _handle_error(self, operation, error):
-        """Handle I2C error - log and optionally call callback."""
+    def _bind_bus(self):
+        """
+        Pick the bus functions for this platform once.
+
+        The register helpers call these directly instead of checking
+        simulate/MICROPYTHON on every access. Signatures:
+        write_byte(address, reg, value), read_byte(address, reg) -> int,
+        write_block(address, reg, data).
+        """
+        if self.simulate:
+            self._bus_write_byte = _sim_write
+            self._bus_read_byte = _sim_read
+            self._bus_write_block = _sim_write
+        elif MICROPYTHON:
+            self._bus_write_byte = self._mp_write_byte
+            self._bus_read_byte = self._mp_read_byte
+            self._bus_write_block = self.i2c.writeto_mem
+        else:
+            self._bus_write_byte = self.bus.write_byte_data
+            self._bus_read_byte = self.bus.read_byte_data
+            self._bus_write_block = self._smbus_write_block
+
+    def _handle_error(self, operation, reg, error):
+        """
+        Handle I2C error - log and optionally call callback.
+
+        The message is only formatted here, so successful transfers
+        never pay for it.
+
+        Args:
+            operation: Constant tag ("write", "read", "write block")
+            reg: Register being accessed
+            error: The exception from the last attempt
+        """
         self._error_count += 1
-        msg = f"PCA9685 @ 0x{self.address:02X}: {operation} failed - {error}"
+        msg = (f"PCA9685 @ 0x{self.address:02X}: {operation} reg "
+               f"0x{reg:02X} failed - {error}")
         print(f"Warning: {msg}")
         if self.on_error:
             try:
@@ -85,69 +165,71 @@ class PCA9685:
             except Exception:
                 pass  # Don't let callback errors propagate
 
-    def _write_byte(self, reg, value):
-        """Write single byte to register with retry logic."""
-        if self.simulate:
-            return True
+    def _retry(self, operation, reg, fn, *args):
+        """
+        Call fn(*args), retrying I2C errors with exponential backoff.
+
+        Args:
+            operation: Operation tag for the error message
+            reg: Register being accessed (for the error message)
+            fn: Bus function to call
 
+        Returns:
+            fn's result, or _FAILED once all retries are used up
+        """
+        delay_us = I2C_RETRY_DELAY_US
         for attempt in range(I2C_RETRIES):
             try:
-                if MICROPYTHON:
-                    self.i2c.writeto_mem(self.address, reg, bytes([value]))
-                else:
-                    self.bus.write_byte_data(self.address, reg, value)
-                return True
+                return fn(*args)
             except (OSError, IOError) as e:
                 if attempt < I2C_RETRIES - 1:
-                    time.sleep(I2C_RETRY_DELAY)
+                    _sleep_us(delay_us)
+                    delay_us <<= 1
                 else:
-                    self._handle_error(f"write reg 0x{reg:02X}", e)
-                    return False
-        return False
+                    self._handle_error(operation, reg, e)
+        return _FAILED
+
+    def _write_byte(self, reg, value):
+        """Write single byte to register with retry logic."""
+        result = self._retry("write", reg, self._bus_write_byte,
+                             self.address, reg, value)
+        return result is not _FAILED
 
     def _read_byte(self, reg):
         """Read single byte from register with retry logic."""
-        if self.simulate:
-            return 0
-
-        for attempt in range(I2C_RETRIES):
-            try:
-                if MICROPYTHON:
-                    return self.i2c.readfrom_mem(self.address, reg, 1)[0]
-                else:
-                    return self.bus.read_byte_data(self.address, reg)
-            except (OSError, IOError) as e:
-                if attempt < I2C_RETRIES - 1:
-                    time.sleep(I2C_RETRY_DELAY)
-                else:
-                    self._handle_error(f"read reg 0x{reg:02X}", e)
-                    return 0
-        return 0
+        result = self._retry("read", reg, self._bus_read_byte,
+                             self.address, reg)
+        return 0 if result is _FAILED else result
 
     def _write_block(self, reg, data):
         """Write multiple bytes to register with retry logic."""
-        if self.simulate:
-            return True
-
-        for attempt in range(I2C_RETRIES):
-            try:
-                if MICROPYTHON:
-                    self.i2c.writeto_mem(self.address, reg, bytes(data))
-                else:
-                    self.bus.write_i2c_block_data(self.address, reg, data)
-                return True
-            except (OSError, IOError) as e:
-                if attempt < I2C_RETRIES - 1:
-                    time.sleep(I2C_RETRY_DELAY)
-                else:
-                    self._handle_error(f"write block reg 0x{reg:02X}", e)
-                    return False
-        return False
+        result = self._retry("write block", reg, self._bus_write_block,
+                             self.address, reg, data)
+        return result is not _FAILED
+
+    def _mp_write_byte(self, address, reg, value):
+        """Write a byte over machine.I2C from the reused 1-byte buffer."""
+        buf = self._byte_buf
+        buf[0] = value
+        self.i2c.writeto_mem(address, reg, buf)
+
+    def _mp_read_byte(self, address, reg):
+        """Read a byte over machine.I2C into the reused 1-byte buffer."""
+        buf = self._byte_buf
+        self.i2c.readfrom_mem_into(address, reg, buf)
+        return buf[0]
+
+    def _smbus_write_block(self, address, reg, data):
+        """Write a block over SMBus, which is limited to 32 bytes per write."""
+        data = list(data)
+        for i in range(0, len(data), 32):
+            self.bus.write_i2c_block_data(address, reg + i, data[i:i + 32])
 
     def _init_device(self):
         """Initialize the PCA9685."""
         # Reset
         self._write_byte(MODE1, 0x00)
+        self._mode1 = 0x00
         time.sleep(0.005)
 
         # Set frequency
@@ -155,6 +237,7 @@ class PCA9685:
 
         # Auto-increment enabled
         self._write_byte(MODE1, 0x20)
+        self._mode1 = 0x20
         time.sleep(0.005)
 
     def set_frequency(self, freq):
@@ -162,8 +245,10 @@ class PCA9685:
         # prescale = round(25MHz / (4096 * freq)) - 1 (per PCA9685 datasheet)
         prescale = round(25000000.0 / (4096.0 * freq)) - 1
         prescale = max(3, min(255, prescale))
+        self.freq = freq
+        self._counts_per_us = 4096.0 * freq / 1000000.0
 
-        old_mode = self._read_byte(MODE1)
+        old_mode = self._mode1
         # Sleep mode to set prescale
         self._write_byte(MODE1, (old_mode & 0x7F) | 0x10)
         self._write_byte(PRESCALE, prescale)
@@ -183,6 +268,23 @@ class PCA9685:
         Returns:
             True if successful, False if I2C error occurred
         """
+        if not self.stage_pwm(channel, pulse_us):
+            return False
+        return self.flush()
+
+    def stage_pwm(self, channel, pulse_us):
+        """
+        Update channel in the register image without touching the bus.
+
+        Staged channels are sent by the next flush() (or set_pwm()).
+
+        Args:
+            channel: 0-15
+            pulse_us: Pulse width in microseconds (0 to disable)
+
+        Returns:
+            True if staged, False if channel is invalid
+        """
         if channel < 0 or channel > 15:
             return False
 
@@ -192,19 +294,56 @@ class PCA9685:
 
         if pulse_us == 0:
             # Full off
-            on = 0
             off = 4096
         else:
             # Convert us to 12-bit value (at 50Hz, period = 20000us)
-            period_us = 1000000.0 / self.freq
-            off = int(pulse_us * 4096 / period_us)
-            off = max(0, min(4095, off))
-            on = 0
+            off = int(pulse_us * self._counts_per_us)
+            if off < 0:
+                off = 0
+            elif off > 4095:
+                off = 4095
+
+        i = 4 * channel
+        frame = self._frame
+        frame[i] = 0
+        frame[i + 1] = 0
+        frame[i + 2] = off & 0xFF
+        frame[i + 3] = off >> 8
+
+        if channel < self._dirty_lo:
+            self._dirty_lo = channel
+        if channel > self._dirty_hi:
+            self._dirty_hi = channel
+        return True
+
+    def flush(self):
+        """
+        Write all staged channels in one auto-increment I2C burst.
 
-        reg = LED0_ON_L + 4 * channel
-        return self._write_block(reg, [
-            on & 0xFF, on >> 8, off & 0xFF, off >> 8
-        ])
+        Returns:
+            True if successful (or nothing staged), False on I2C error
+        """
+        lo, hi = self._dirty_lo, self._dirty_hi
+        if hi < lo:
+            return True
+        self._dirty_lo = 16
+        self._dirty_hi = -1
+        return self._write_block(_CH_REGS[lo],
+                                 self._frame_mv[4 * lo:4 * (hi + 1)])
+
+    def set_all_pwm(self, pulses):
+        """
+        Set all channels in one auto-increment I2C burst.
+
+        Args:
+            pulses: 16 pulse widths in microseconds (0 to disable)
+
+        Returns:
+            True if successful, False if I2C error occurred
+        """
+        for channel, pulse_us in enumerate(pulses):
+            self.stage_pwm(channel, pulse_us)
+        return self.flush()
 
     def set_angle(self, channel, angle, min_pulse=500, max_pulse=2500):
         """
@@ -217,17 +356,42 @@ class PCA9685:
             max_pulse: Pulse width at 180 degrees (us)
         """
         angle = max(0, min(180, angle))
-        pulse = min_pulse + (angle / 180.0) * (max_pulse - min_pulse)
+        pulse = min_pulse + angle * (max_pulse - min_pulse) * _PER_DEGREE
         self.set_pwm(channel, int(pulse))
 
+    def set_angles(self, angles, min_pulses=None, max_pulses=None):
+        """
+        Set servo angles for channels 0..len(angles)-1 in one I2C burst.
+
+        Args:
+            angles: 0-180 degrees per channel
+            min_pulses: Per-channel pulse width at 0 degrees (us),
+                500 for every channel if None
+            max_pulses: Per-channel pulse width at 180 degrees (us),
+                2500 for every channel if None
+
+        Returns:
+            True if successful, False if I2C error occurred
+        """
+        stage = self.stage_pwm
+        for channel, angle in enumerate(angles):
+            min_pulse = 500 if min_pulses is None else min_pulses[channel]
+            max_pulse = 2500 if max_pulses is None else max_pulses[channel]
+            if angle < 0:
+                angle = 0
+            elif angle > 180:
+                angle = 180
+            pulse = min_pulse + angle * (max_pulse - min_pulse) * _PER_DEGREE
+            stage(channel, int(pulse))
+        return self.flush()
+
     def disable(self, channel):
         """Disable PWM output (servo goes limp)."""
         self.set_pwm(channel, 0)
 
     def disable_all(self):
         """Disable all channels."""
-        for ch in range(16):
-            self.disable(ch)
+        self.set_all_pwm(_ALL_OFF)
 
 
 if __name__ == '__main__':
@@ -345,7 +345,9 @@ class PicoController:
         self.send_response("READY")
 
         last_sensor_check = time.ticks_ms()
-        sensor_interval = 100  # Check sensors every 100ms
+        last_battery_check = last_sensor_check
+        sensor_interval = 100    # Check sensors every 100ms
+        battery_interval = 5000  # Check battery every 5s
 
         while self.running:
             # Check for UART commands
@@ -364,9 +366,10 @@ class PicoController:
                 last_sensor_check = now
                 self.check_balance()
 
-                # Battery check less frequently
-                if now % 5000 < sensor_interval:
-                    self.check_battery()
+            # Battery check less frequently (ticks_diff is wrap-safe)
+            if time.ticks_diff(now, last_battery_check) >= battery_interval:
+                last_battery_check = now
+                self.check_battery()
 
             # Small delay to prevent busy-waiting
             time.sleep(0.01)
@@ -8,6 +8,7 @@ Note: Multiple VL53L0X sensors require XSHUT pin control to set unique addresses
 """
 
 import time
+import micropython
 
 # Registers (subset - VL53L0X has many registers)
 SYSRANGE_START = 0x00
@@ -23,20 +24,60 @@ IDENTIFICATION_MODEL_ID = 0xC0
 # Default address
 DEFAULT_ADDRESS = 0x29
 
+# Measurement-complete polling intervals
+DRDY_POLL_US = 100    # GPIO1 pin (no I2C cost)
+STATUS_POLL_MS = 5    # RESULT_INTERRUPT_STATUS over I2C
+
+# Register/value pairs written before each ranging start (ST API
+# "stop variable" page handshake, simplified). Values are prebuilt
+# 1-byte bytes so the writes don't allocate.
+_WAKE_SEQ = (
+    (0x80, b'\x01'),
+    (0xFF, b'\x01'),
+    (0x00, b'\x00'),
+    (0x00, b'\x01'),
+    (0xFF, b'\x00'),
+    (0x80, b'\x00'),
+)
+
+# Stop ranging, then the same page handshake
+_STOP_SEQ = (
+    (SYSRANGE_START, b'\x01'),
+    (0xFF, b'\x01'),
+    (0x00, b'\x00'),
+    (0x00, b'\x01'),
+    (0xFF, b'\x00'),
+)
+
+
+@micropython.viper
+def _decode_distance(buf: ptr8) -> int:
+    """Distance in mm from a RESULT_RANGE_STATUS block (bytes 10-11)."""
+    return (buf[10] << 8) | buf[11]
+
 
 class VL53L0X:
     """VL53L0X Time-of-Flight distance sensor driver."""
 
-    def __init__(self, i2c, address=DEFAULT_ADDRESS, xshut_pin=None):
+    def __init__(self, i2c, address=DEFAULT_ADDRESS, xshut_pin=None,
+                 gpio1_pin=None):
         """
         Args:
             i2c: I2C bus instance
             address: I2C address (0x29 default)
             xshut_pin: Optional Pin object for XSHUT control
+            gpio1_pin: Optional input Pin wired to GPIO1 (data ready,
+                active low) - read() waits on it instead of polling I2C
         """
         self.i2c = i2c
         self.address = address
         self.xshut = xshut_pin
+        self._drdy = gpio1_pin
+
+        # Bus buffers, reused so status polling and register writes
+        # don't allocate
+        self._result_buf = bytearray(12)  # RESULT_RANGE_STATUS .. distance
+        self._byte_buf = bytearray(1)
 
         # If XSHUT provided, ensure sensor is enabled
         if self.xshut:
@@ -47,7 +88,16 @@ class VL53L0X:
 
     def _write_byte(self, reg, value):
         """Write single byte to register."""
-        self.i2c.writeto_mem(self.address, reg, bytes([value]))
+        buf = self._byte_buf
+        buf[0] = value
+        self.i2c.writeto_mem(self.address, reg, buf)
+
+    def _write_seq(self, seq):
+        """Write a sequence of (reg, 1-byte bytes) pairs."""
+        write = self.i2c.writeto_mem
+        address = self.address
+        for reg, value in seq:
+            write(address, reg, value)
 
     def _write_bytes(self, reg, data):
         """Write multiple bytes to register."""
@@ -55,11 +105,34 @@ class VL53L0X:
 
     def _read_byte(self, reg):
         """Read single byte from register."""
-        return self.i2c.readfrom_mem(self.address, reg, 1)[0]
+        self.i2c.readfrom_mem_into(self.address, reg, self._byte_buf)
+        return self._byte_buf[0]
+
+    def _read_result(self):
+        """
+        Read the result block into the preallocated buffer.
+
+        Status and distance are picked out with shifts - cheaper than
+        struct on MicroPython, which has no precompiled struct.Struct.
+        The distance bytes are combined by a viper helper.
+
+        Returns:
+            tuple: (range_status, distance_mm)
+        """
+        buf = self._result_buf
+        self.i2c.readfrom_mem_into(self.address, RESULT_RANGE_STATUS, buf)
+        return (buf[0] & 0x78) >> 3, _decode_distance(buf)
 
-    def _read_bytes(self, reg, length):
-        """Read multiple bytes from register."""
-        return self.i2c.readfrom_mem(self.address, reg, length)
+    def data_ready(self):
+        """
+        Check whether a measurement result is waiting.
+
+        Returns:
+            bool: True if RESULT_INTERRUPT_STATUS reports a new sample
+        """
+        buf = self._byte_buf
+        self.i2c.readfrom_mem_into(self.address, RESULT_INTERRUPT_STATUS, buf)
+        return (buf[0] & 0x07) != 0
 
     def _init_device(self):
         """Initialize the VL53L0X with default settings."""
@@ -71,12 +144,7 @@ class VL53L0X:
         # Standard initialization sequence (simplified)
         # Full init would include SPAD calibration, ref calibration, etc.
         self._write_byte(0x88, 0x00)
-        self._write_byte(0x80, 0x01)
-        self._write_byte(0xFF, 0x01)
-        self._write_byte(0x00, 0x00)
-        self._write_byte(0x00, 0x01)
-        self._write_byte(0xFF, 0x00)
-        self._write_byte(0x80, 0x00)
+        self._write_seq(_WAKE_SEQ)
 
         # Configure interrupt
         self._write_byte(SYSTEM_INTERRUPT_CONFIG_GPIO, 0x04)
@@ -111,6 +179,34 @@ class VL53L0X:
         if self.xshut:
             self.xshut.value(0)
 
+    def start_range(self):
+        """
+        Start a single-shot measurement without waiting for it.
+
+        Poll data_ready() (or the GPIO1 pin), then call fetch().
+        """
+        self._write_seq(_WAKE_SEQ)
+        self._write_byte(SYSRANGE_START, 0x01)
+
+    def fetch(self):
+        """
+        Read a completed measurement and clear the interrupt.
+
+        Only valid once data_ready() is True.
+
+        Returns:
+            int: Distance in mm, or -1 if the range status is an error
+        """
+        range_status, distance = self._read_result()
+        self._write_byte(SYSTEM_INTERRUPT_CLEAR, 0x01)
+
+        # Check for errors (range status)
+        if range_status != 0 and range_status != 11:
+            # Error conditions (except "no error" and "range valid")
+            return -1
+
+        return distance
+
     def read(self, timeout_ms=500):
         """
         Perform single-shot measurement.
@@ -121,14 +217,7 @@ class VL53L0X:
         Returns:
             int: Distance in mm, or -1 if error/timeout
         """
-        # Start measurement
-        self._write_byte(0x80, 0x01)
-        self._write_byte(0xFF, 0x01)
-        self._write_byte(0x00, 0x00)
-        self._write_byte(0x00, 0x01)
-        self._write_byte(0xFF, 0x00)
-        self._write_byte(0x80, 0x00)
-        self._write_byte(SYSRANGE_START, 0x01)
+        self.start_range()
 
         # Wait for start
         start = time.ticks_ms()
@@ -138,25 +227,21 @@ class VL53L0X:
             time.sleep(0.001)
 
         # Wait for measurement complete
-        while (self._read_byte(RESULT_INTERRUPT_STATUS) & 0x07) == 0:
-            if time.ticks_diff(time.ticks_ms(), start) > timeout_ms:
-                return -1
-            time.sleep(0.001)
-
-        # Read result
-        data = self._read_bytes(RESULT_RANGE_STATUS, 12)
-        distance = (data[10] << 8) | data[11]
-
-        # Clear interrupt
-        self._write_byte(SYSTEM_INTERRUPT_CLEAR, 0x01)
-
-        # Check for errors (range status)
-        range_status = (data[0] & 0x78) >> 3
-        if range_status != 0 and range_status != 11:
-            # Error conditions (except "no error" and "range valid")
-            return -1
+        drdy = self._drdy
+        if drdy:
+            # GPIO1 goes low when the result is ready - no bus traffic
+            while drdy.value():
+                if time.ticks_diff(time.ticks_ms(), start) > timeout_ms:
+                    return -1
+                time.sleep_us(DRDY_POLL_US)
+        else:
+            # A measurement takes ~33ms, so poll the status register sparingly
+            while not self.data_ready():
+                if time.ticks_diff(time.ticks_ms(), start) > timeout_ms:
+                    return -1
+                time.sleep_ms(STATUS_POLL_MS)
 
-        return distance
+        return self.fetch()
 
     def start_continuous(self, period_ms=0):
         """
@@ -165,12 +250,7 @@ class VL53L0X:
         Args:
             period_ms: Measurement period (0 = back-to-back)
         """
-        self._write_byte(0x80, 0x01)
-        self._write_byte(0xFF, 0x01)
-        self._write_byte(0x00, 0x00)
-        self._write_byte(0x00, 0x01)
-        self._write_byte(0xFF, 0x00)
-        self._write_byte(0x80, 0x00)
+        self._write_seq(_WAKE_SEQ)
 
         if period_ms > 0:
             # Timed mode
@@ -179,6 +259,7 @@ class VL53L0X:
             # Back-to-back mode
             self._write_byte(SYSRANGE_START, 0x02)
 
+    @micropython.native
     def read_continuous(self):
         """
         Read from continuous measurement mode.
@@ -186,22 +267,17 @@ class VL53L0X:
         Returns:
             int: Distance in mm, or -1 if not ready
         """
-        if (self._read_byte(RESULT_INTERRUPT_STATUS) & 0x07) == 0:
+        if not self.data_ready():
             return -1
 
-        data = self._read_bytes(RESULT_RANGE_STATUS, 12)
-        distance = (data[10] << 8) | data[11]
+        _, distance = self._read_result()
 
         self._write_byte(SYSTEM_INTERRUPT_CLEAR, 0x01)
         return distance
 
     def stop_continuous(self):
         """Stop continuous measurement mode."""
-        self._write_byte(SYSRANGE_START, 0x01)
-        self._write_byte(0xFF, 0x01)
-        self._write_byte(0x00, 0x00)
-        self._write_byte(0x00, 0x01)
-        self._write_byte(0xFF, 0x00)
+        self._write_seq(_STOP_SEQ)
 
 
 class VL53L0XArray:
@@ -211,18 +287,21 @@ class VL53L0XArray:
     Handles address assignment at startup.
     """
 
-    def __init__(self, i2c, xshut_pins, addresses=None):
+    def __init__(self, i2c, xshut_pins, addresses=None, gpio1_pins=None):
         """
         Args:
             i2c: I2C bus instance
             xshut_pins: List of Pin objects for XSHUT control
             addresses: List of I2C addresses to assign (default: 0x29, 0x30, 0x31, ...)
+            gpio1_pins: Optional list of data-ready input Pins (same order)
         """
         self.i2c = i2c
         self.sensors = []
 
         if addresses is None:
             addresses = [0x29 + i for i in range(len(xshut_pins))]
+        if gpio1_pins is None:
+            gpio1_pins = [None] * len(xshut_pins)
 
         # Disable all sensors
         for pin in xshut_pins:
@@ -230,13 +309,14 @@ class VL53L0XArray:
         time.sleep(0.01)
 
         # Enable and configure each sensor one at a time
-        for i, (pin, addr) in enumerate(zip(xshut_pins, addresses)):
+        for i, (pin, addr, drdy) in enumerate(zip(xshut_pins, addresses,
+                                                  gpio1_pins)):
             # Enable this sensor
             pin.value(1)
             time.sleep(0.01)
 
             # Create sensor at default address
-            sensor = VL53L0X(i2c, DEFAULT_ADDRESS, pin)
+            sensor = VL53L0X(i2c, DEFAULT_ADDRESS, pin, drdy)
 
             # Change to unique address (if not first sensor)
             if addr != DEFAULT_ADDRESS:
@@ -245,14 +325,48 @@ class VL53L0XArray:
             self.sensors.append(sensor)
             print(f"VL53L0X #{i} configured at 0x{addr:02X}")
 
-    def read_all(self):
+        # Readings list reused by read_all()
+        self._readings = [-1] * len(self.sensors)
+
+    def read_all(self, timeout_ms=500):
         """
         Read all sensors.
 
+        All measurements are started first, then the sensors are polled
+        round-robin, so the ~33ms ranging times overlap instead of adding
+        up. Each sensor has its own I2C address, so results cannot share
+        one auto-increment transfer.
+
+        Args:
+            timeout_ms: Maximum time to wait for all measurements
+
         Returns:
-            list: Distance readings in mm for each sensor
+            list: Distance readings in mm for each sensor, -1 on
+            error/timeout (the same list object is updated in place on
+            every call)
         """
-        return [s.read() for s in self.sensors]
+        readings = self._readings
+        sensors = self.sensors
+        n = len(sensors)
+        for i in range(n):
+            readings[i] = -1
+            sensors[i].start_range()
+
+        # Bit i set while sensor i is still ranging
+        waiting = (1 << n) - 1
+        start = time.ticks_ms()
+        while waiting:
+            for i in range(n):
+                bit = 1 << i
+                if waiting & bit and sensors[i].data_ready():
+                    readings[i] = sensors[i].fetch()
+                    waiting &= ~bit
+            if not waiting:
+                break
+            if time.ticks_diff(time.ticks_ms(), start) > timeout_ms:
+                break
+            time.sleep_ms(STATUS_POLL_MS)
+        return readings
 
     def __getitem__(self, index):
         """Get sensor by index."""
@@ -9,18 +9,158 @@ Runs on Pi Zero 2W. Handles:
 
 Requires:
     pip install flask opencv-python-headless picamera2
+
+Optional:
+    pip install orjson      # faster /status JSON
 """
 
-import serial
+import os
+import array
+import fcntl
+import select
+import termios
 import threading
 import time
 import json
-from queue import Queue, Empty
+import itertools
+from collections import deque
 
 # Serial connection to Pico
 PICO_SERIAL = '/dev/serial0'
 BAUD_RATE = 115200
 
+# Reader thread wakes at least this often to notice disconnect()
+READ_WAKE_S = 0.2
+READ_CHUNK = 4096
+
+# serial_struct flag: push received bytes to readers immediately
+ASYNC_LOW_LATENCY = 0x2000
+
+# Prebuilt gait commands (unknown names are still sent, for the ERR reply)
+_GAIT_CMDS = {'tripod': b'G:tripod', 'wave': b'G:wave', 'ripple': b'G:ripple'}
+
+# Unclaimed responses kept for wait_response() (oldest dropped first)
+RESPONSE_BACKLOG = 64
+
+# MJPEG stream: encode quality (OpenCV fallback) and number of
+# published frames kept
+JPEG_QUALITY = 70
+JPEG_RING = 3
+
+# multipart/x-mixed-replace framing around each published JPEG
+_MJPEG_HEAD = b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'
+_MJPEG_TAIL = b'\r\n'
+
+# Obstacle detection runs on frames shrunk by this factor per axis
+DETECT_DOWNSCALE = 2
+
+# CPU placement on the Zero 2W's four cores: UART reader, camera
+# (libcamera, encoder and producer threads), web server threads
+READER_CPUS = {0}
+CAMERA_CPUS = {1}
+WEB_CPUS = {2, 3}
+# SCHED_FIFO priority for the UART reader (needs CAP_SYS_NICE)
+READER_RT_PRIORITY = 20
+
+
+def _pin_thread(cpus, rt_priority=None):
+    """
+    Pin the calling thread to cpus, optionally with SCHED_FIFO priority.
+
+    Threads it starts afterwards inherit the placement. Best effort:
+    skipped on machines with fewer CPUs, and errors (e.g. no
+    CAP_SYS_NICE for real-time priority) are reported and ignored.
+    """
+    if max(cpus) >= (os.cpu_count() or 1):
+        return
+    try:
+        os.sched_setaffinity(0, cpus)
+        if rt_priority is not None:
+            os.sched_setscheduler(0, os.SCHED_FIFO,
+                                  os.sched_param(rt_priority))
+    except (OSError, AttributeError) as e:
+        print(f"CPU placement skipped: {e}")
+
+
+class RawSerial:
+    """
+    Minimal non-blocking serial port on a raw file descriptor.
+
+    The port is configured once (raw 8N1, no flow control), so reads and
+    writes are plain os.read()/os.write() calls with no per-call termios
+    or ioctl work.
+    """
+
+    def __init__(self, port, baudrate):
+        """
+        Args:
+            port: Device path (e.g. /dev/serial0)
+            baudrate: Line speed, must have a termios B<rate> constant
+        """
+        speed = getattr(termios, f"B{baudrate}", None)
+        if speed is None:
+            raise ValueError(f"Unsupported baud rate: {baudrate}")
+
+        self.fd = os.open(port, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            iflag, oflag, cflag, lflag, _, _, cc = termios.tcgetattr(self.fd)
+            # Raw mode (as cfmakeraw), 8N1, receiver on, ignore modem lines
+            iflag &= ~(termios.IGNBRK | termios.BRKINT | termios.PARMRK |
+                       termios.ISTRIP | termios.INLCR | termios.IGNCR |
+                       termios.ICRNL | termios.IXON | termios.IXOFF)
+            oflag &= ~termios.OPOST
+            lflag &= ~(termios.ECHO | termios.ECHONL | termios.ICANON |
+                       termios.ISIG | termios.IEXTEN)
+            cflag &= ~(termios.CSIZE | termios.PARENB | termios.CSTOPB |
+                       termios.CRTSCTS)
+            cflag |= termios.CS8 | termios.CREAD | termios.CLOCAL
+            cc[termios.VMIN] = 0
+            cc[termios.VTIME] = 0
+            termios.tcsetattr(self.fd, termios.TCSANOW,
+                              [iflag, oflag, cflag, lflag, speed, speed, cc])
+            termios.tcflush(self.fd, termios.TCIOFLUSH)
+        except Exception:
+            os.close(self.fd)
+            raise
+
+        self._set_low_latency()
+
+    def _set_low_latency(self):
+        """Ask the driver not to batch received bytes (best effort)."""
+        try:
+            info = array.array('i', [0] * 32)  # struct serial_struct
+            fcntl.ioctl(self.fd, termios.TIOCGSERIAL, info)
+            info[4] |= ASYNC_LOW_LATENCY  # flags
+            fcntl.ioctl(self.fd, termios.TIOCSSERIAL, info)
+        except (AttributeError, OSError):
+            pass  # Not every UART driver supports it
+
+    def fileno(self):
+        """File descriptor, for select()."""
+        return self.fd
+
+    def read(self, n):
+        """Read up to n bytes without blocking (b'' if none waiting)."""
+        try:
+            return os.read(self.fd, n)
+        except BlockingIOError:
+            return b''
+
+    def write(self, data):
+        """Write all of data, waiting for room in the TX buffer."""
+        view = memoryview(data)
+        while view:
+            try:
+                n = os.write(self.fd, view)
+            except BlockingIOError:
+                select.select([], [self.fd], [])
+                continue
+            view = view[n:]
+
+    def close(self):
+        """Close the port."""
+        os.close(self.fd)
+
 
 class PicoInterface:
     """UART interface to Pi Pico."""
@@ -29,7 +169,15 @@ class PicoInterface:
         self.port = port
         self.baudrate = baudrate
         self.serial = None
-        self.response_queue = Queue()
+        self._write_lock = threading.Lock()
+        # Responses from the reader thread; deque append/popleft are
+        # atomic, and the event wakes wait_response()
+        self._responses = deque((), RESPONSE_BACKLOG)
+        self._response_event = threading.Event()
+        # send_and_wait() requests awaiting their tagged reply:
+        # {request_id: [Event, response]}
+        self._pending = {}
+        self._request_ids = itertools.count(1)
         self.running = False
         self.reader_thread = None
 
@@ -38,10 +186,24 @@ class PicoInterface:
         self.last_dist = (-1, -1, -1)
         self.last_bat = (0, 0, 0)
 
+        # Set by the reader thread when each status cache is refreshed
+        self.imu_event = threading.Event()
+        self.dist_event = threading.Event()
+        self.bat_event = threading.Event()
+
+        # Handlers for <KIND>:<data> status lines
+        self._status_handlers = {
+            'IMU': self._on_imu,
+            'DIST': self._on_dist,
+            'BAT': self._on_bat,
+            'WARN': self._on_warn,
+            'ERR': self._on_err,
+        }
+
     def connect(self):
         """Connect to Pico via serial."""
         try:
-            self.serial = serial.Serial(self.port, self.baudrate, timeout=0.1)
+            self.serial = RawSerial(self.port, self.baudrate)
             time.sleep(0.5)  # Wait for Pico to reset
 
             # Start reader thread
@@ -70,43 +232,113 @@ class PicoInterface:
             self.serial = None
 
     def _read_loop(self):
-        """Background thread to read serial responses."""
+        """
+        Background thread to read serial responses.
+
+        Blocks in select() until bytes arrive, so responses are handled
+        as soon as they come in rather than on a polling tick.
+        """
+        _pin_thread(READER_CPUS, READER_RT_PRIORITY)
+        buf = bytearray()
         while self.running and self.serial:
             try:
-                if self.serial.in_waiting:
-                    line = self.serial.readline().decode().strip()
-                    if line:
-                        self._handle_response(line)
+                ready, _, _ = select.select([self.serial], [], [], READ_WAKE_S)
+                if not ready:
+                    continue
+                buf += self.serial.read(READ_CHUNK)
+
+                # Handle every complete line received so far; a bad line
+                # is dropped without holding up the ones behind it
+                nl = buf.find(b'\n')
+                while nl >= 0:
+                    line = bytes(buf[:nl])
+                    del buf[:nl + 1]
+                    nl = buf.find(b'\n')
+                    try:
+                        line = line.decode(errors='replace').strip()
+                        if line:
+                            self._handle_response(line)
+                    except Exception as e:
+                        print(f"Bad response {line!r}: {e}")
             except Exception as e:
                 print(f"Serial read error: {e}")
-            time.sleep(0.01)
+                time.sleep(0.01)
 
     def _handle_response(self, response):
         """Handle response from Pico."""
-        # Parse status updates
-        if response.startswith('IMU:'):
-            parts = response[4:].split(',')
-            self.last_imu = tuple(float(p) for p in parts)
-        elif response.startswith('DIST:'):
-            parts = response[5:].split(',')
-            self.last_dist = tuple(int(p) for p in parts)
-        elif response.startswith('BAT:'):
-            parts = response[4:].split(',')
-            self.last_bat = (float(parts[0]), float(parts[1]), float(parts[2]))
-        elif response.startswith('WARN:'):
-            print(f"Warning from Pico: {response[5:]}")
-        elif response.startswith('ERR:'):
-            print(f"Error from Pico: {response[4:]}")
-
-        # Queue all responses
-        self.response_queue.put(response)
+        # Replies to send_and_wait() end with the request's ;#<id>
+        body, sep, tag = response.rpartition(';#')
+        waiter = None
+        if sep:
+            response = body
+            try:
+                waiter = self._pending.get(int(tag))
+            except ValueError:
+                pass
+
+        # Parse status updates: one split, one table lookup
+        kind, colon, data = response.partition(':')
+        if colon:
+            handler = self._status_handlers.get(kind)
+            if handler:
+                handler(data)
+
+        if waiter:
+            waiter[1] = response
+            waiter[0].set()
+        elif not sep:
+            # Queue untagged responses (READY, status broadcasts, ...)
+            self._responses.append(response)
+            self._response_event.set()
+
+    # Status line handlers (fixed three-field records, unpacked positionally)
+
+    def _on_imu(self, data):
+        """IMU:<roll>,<pitch>,<yaw>"""
+        roll, pitch, yaw = data.split(',')
+        self.last_imu = (float(roll), float(pitch), float(yaw))
+        self.imu_event.set()
+
+    def _on_dist(self, data):
+        """DIST:<front>,<left>,<right>"""
+        front, left, right = data.split(',')
+        self.last_dist = (int(front), int(left), int(right))
+        self.dist_event.set()
+
+    def _on_bat(self, data):
+        """BAT:<voltage>,<current>,<soc>"""
+        voltage, current, soc = data.split(',')
+        self.last_bat = (float(voltage), float(current), float(soc))
+        self.bat_event.set()
+
+    def _on_warn(self, data):
+        """WARN:<message>"""
+        print(f"Warning from Pico: {data}")
+
+    def _on_err(self, data):
+        """ERR:<message>"""
+        print(f"Error from Pico: {data}")
 
     def send_command(self, cmd):
         """Send command to Pico."""
+        return self.send_commands((cmd,))
+
+    def send_commands(self, cmds):
+        """
+        Send several commands to Pico in one serial write.
+
+        Args:
+            cmds: Command strings (without newlines)
+        """
+        return self._write(("\n".join(cmds) + "\n").encode())
+
+    def _write(self, data):
+        """Write encoded, newline-terminated command bytes."""
         if not self.serial:
             return False
         try:
-            self.serial.write(f"{cmd}\n".encode())
+            with self._write_lock:
+                self.serial.write(data)
             return True
         except Exception as e:
             print(f"Send error: {e}")
@@ -114,68 +346,118 @@ class PicoInterface:
 
     def wait_response(self, timeout=1.0):
         """Wait for response from Pico."""
-        try:
-            return self.response_queue.get(timeout=timeout)
-        except Empty:
-            return None
+        responses = self._responses
+        event = self._response_event
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return responses.popleft()
+            except IndexError:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            # Re-check after clearing so a response appended in between
+            # isn't missed
+            event.clear()
+            if not responses:
+                event.wait(remaining)
 
     def send_and_wait(self, cmd, timeout=2.0):
-        """Send command and wait for response."""
-        # Clear queue
-        while not self.response_queue.empty():
-            self.response_queue.get_nowait()
+        """
+        Send command and wait for its response.
 
-        if not self.send_command(cmd):
-            return None
+        The command is tagged with a request ID that the Pico echoes, so
+        the reply is matched exactly - other responses arriving in the
+        meantime are neither consumed nor discarded.
 
-        return self.wait_response(timeout)
+        Args:
+            cmd: Command as str or bytes (without newline)
+        """
+        if isinstance(cmd, str):
+            cmd = cmd.encode()
+        request_id = next(self._request_ids) & 0xFFFFFFFF
+        waiter = [threading.Event(), None]
+        self._pending[request_id] = waiter
+        try:
+            if not self._write(b"%s;#%d\n" % (cmd, request_id)):
+                return None
+            waiter[0].wait(timeout)
+            return waiter[1]
+        finally:
+            del self._pending[request_id]
 
     # High-level commands
     def walk(self, dx, dy):
-        """Walk in direction."""
-        return self.send_and_wait(f"W:{dx},{dy}")
+        """Walk in direction (whole mm)."""
+        return self.send_and_wait(b"W:%d,%d" % (dx, dy))
 
     def turn(self, angle):
         """Turn in place."""
-        return self.send_and_wait(f"T:{angle}")
+        return self.send_and_wait(b"T:%g" % angle)
 
     def stop(self):
         """Stop and stand."""
-        return self.send_and_wait("S")
+        return self.send_and_wait(b"S")
 
     def set_gait(self, gait):
         """Set gait type (tripod, wave, ripple)."""
-        return self.send_and_wait(f"G:{gait}")
+        cmd = _GAIT_CMDS.get(gait)
+        if cmd is None:
+            cmd = b"G:" + gait.encode()
+        return self.send_and_wait(cmd)
 
     def set_height(self, height):
         """Set standing height in mm."""
-        return self.send_and_wait(f"H:{height}")
+        return self.send_and_wait(b"H:%d" % height)
 
     def center(self):
         """Center all servos."""
-        return self.send_and_wait("C")
+        return self.send_and_wait(b"C")
 
     def boot(self):
         """Run boot sequence."""
-        return self.send_and_wait("B", timeout=5)
+        return self.send_and_wait(b"B", timeout=5)
 
     def shutdown(self):
         """Run shutdown sequence."""
-        return self.send_and_wait("D", timeout=5)
+        return self.send_and_wait(b"D", timeout=5)
 
     def get_status(self):
         """Get Pico status."""
-        return self.send_and_wait("?")
+        return self.send_and_wait(b"?")
+
+    def update_sensors(self, timeout=0.1):
+        """
+        Request sensor updates and wait until they arrive.
+
+        Returns as soon as all three responses are in, or after timeout
+        seconds (the caches then keep their previous values).
+
+        Returns:
+            True if all three sensor caches were refreshed
+        """
+        events = (self.imu_event, self.dist_event, self.bat_event)
+        for event in events:
+            event.clear()
+
+        self.send_commands(("IMU", "DIST", "BAT"))
 
-    def update_sensors(self):
-        """Request sensor updates."""
-        self.send_command("IMU")
-        self.send_command("DIST")
-        self.send_command("BAT")
+        deadline = time.monotonic() + timeout
+        for event in events:
+            if not event.wait(max(0, deadline - time.monotonic())):
+                return False
+        return True
 
 
 class CameraProcessor:
-    """Camera capture and processing using OpenCV."""
+    """
+    Camera capture and processing using OpenCV.
+
+    Runs in the web process on threads: capture happens in libcamera's
+    own threads, JPEG encoding in the hardware encoder, and OpenCV calls
+    release the GIL, so Flask and the Pico reader are not starved.
+    """
 
     def __init__(self, resolution=(640, 480), framerate=10):
         self.resolution = resolution
@@ -184,88 +466,299 @@ class CameraProcessor:
         self.running = False
         self.frame = None
         self.frame_lock = threading.Lock()
+        self.producer_thread = None
+        self.encoder = None
+
+        # Encoded JPEGs published by a single producer (hardware encoder
+        # or producer thread) as (seq, multipart part bytes). Readers take
+        # the slot of _latest_seq; the producer only writes the next slot,
+        # so no lock is needed.
+        self._jpeg_slots = [None] * JPEG_RING
+        self._latest_seq = -1
+        # Notified on every publish so stream clients wake per frame
+        # (a Condition rather than an Event: with several clients, one
+        # clearing an Event would make the others miss the frame)
+        self._new_frame = threading.Condition()
+
+        # detect_obstacles() work buffers, (re)allocated when the frame
+        # shape changes
+        self._detect_shape = None
+        self._detect_bufs = None
 
     def start(self):
-        """Start camera capture."""
+        """Start camera capture and the JPEG stream producer."""
         try:
             from picamera2 import Picamera2
             self.camera = Picamera2()
-            config = self.camera.create_preview_configuration(
-                main={"size": self.resolution}
+            config = self.camera.create_video_configuration(
+                main={"size": self.resolution},
+                controls={"FrameRate": self.framerate},
+                buffer_count=3,
             )
             self.camera.configure(config)
             self.camera.start()
             self.running = True
+            if not self._start_encoder():
+                # No hardware encoder - encode with OpenCV instead
+                self.producer_thread = threading.Thread(
+                    target=self._producer_loop, daemon=True)
+                self.producer_thread.start()
             print("Camera started")
             return True
         except Exception as e:
             print(f"Camera init failed: {e}")
             return False
 
+    def _start_encoder(self):
+        """
+        Stream the main camera output through picamera2's MJPEG encoder.
+
+        The encoder runs on the GPU's V4L2 JPEG block and publishes
+        straight into the JPEG ring, so no frame passes through OpenCV.
+
+        Returns:
+            True if the hardware encoder is running
+        """
+        try:
+            from picamera2.encoders import MJPEGEncoder
+            from picamera2.outputs import Output
+        except ImportError:
+            return False
+
+        publish = self._publish_jpeg
+
+        class RingOutput(Output):
+            """picamera2 output that publishes each encoded frame."""
+
+            def outputframe(self, frame, keyframe=True, timestamp=None,
+                            *args, **kwargs):
+                publish(frame)
+
+        try:
+            encoder = MJPEGEncoder()
+            self.camera.start_encoder(encoder, RingOutput())
+        except Exception as e:
+            print(f"Hardware JPEG encoder unavailable: {e}")
+            return False
+        self.encoder = encoder
+        return True
+
+    def _producer_loop(self):
+        """
+        Capture and JPEG-encode each frame once for all stream clients.
+
+        Fallback for when the hardware encoder is unavailable.
+        Frames are encoded straight from the camera buffer, and capturing
+        blocks until the camera delivers the next frame, so this runs at
+        the configured framerate.
+        """
+        _pin_thread(CAMERA_CPUS)
+        import cv2
+        params = [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY]
+
+        def encode(frame):
+            ok, jpeg = cv2.imencode('.jpg', frame, params)
+            return jpeg if ok else None
+
+        while self.running:
+            jpeg = self._with_frame(encode)
+            if jpeg is None:
+                time.sleep(0.1)
+                continue
+            self._publish_jpeg(jpeg)
+
+    def _publish_jpeg(self, jpeg):
+        """
+        Publish an encoded frame to stream readers (producer only).
+
+        The multipart framing is added here, once per frame, so every
+        stream client sends the same bytes object without copying.
+
+        Args:
+            jpeg: Encoded frame (any bytes-like object)
+        """
+        part = b''.join((_MJPEG_HEAD, jpeg, _MJPEG_TAIL))
+        seq = self._latest_seq + 1
+        self._jpeg_slots[seq % JPEG_RING] = (seq, part)
+        with self._new_frame:
+            self._latest_seq = seq
+            self._new_frame.notify_all()
+
+    def get_mjpeg_part(self):
+        """
+        Get the most recently published frame as an MJPEG stream part.
+
+        Returns:
+            (seq, bytes) tuple, or None before the first frame
+        """
+        seq = self._latest_seq
+        if seq < 0:
+            return None
+        return self._jpeg_slots[seq % JPEG_RING]
+
+    def wait_mjpeg_part(self, last_seq, timeout=1.0):
+        """
+        Wait for a frame newer than last_seq.
+
+        Args:
+            last_seq: Sequence number of the frame the caller already has
+            timeout: Max seconds to wait
+
+        Returns:
+            (seq, bytes) tuple (may still be last_seq on timeout),
+            or None before the first frame
+        """
+        with self._new_frame:
+            self._new_frame.wait_for(
+                lambda: self._latest_seq != last_seq, timeout)
+        return self.get_mjpeg_part()
+
     def stop(self):
         """Stop camera capture."""
         self.running = False
+        if self.producer_thread:
+            self.producer_thread.join(timeout=1.0)
+            self.producer_thread = None
+        if self.encoder:
+            self.camera.stop_encoder()
+            self.encoder = None
         if self.camera:
             self.camera.stop()
             self.camera.close()
             self.camera = None
 
-    def capture_frame(self):
-        """Capture a frame."""
+    def _with_frame(self, func):
+        """
+        Call func on the next camera frame without copying it.
+
+        The frame is a numpy view of the camera's mapped DMA buffer and
+        is only valid during the call; func must copy anything it keeps.
+
+        Returns:
+            Result of func(frame), or None if capture failed
+        """
         if not self.camera:
             return None
         try:
-            frame = self.camera.capture_array()
-            with self.frame_lock:
-                self.frame = frame
-            return frame
+            from picamera2 import MappedArray
+            with self.camera.captured_request() as request:
+                with MappedArray(request, 'main') as mapped:
+                    return func(mapped.array)
         except Exception as e:
             print(f"Capture error: {e}")
             return None
 
+    def capture_frame(self):
+        """Capture a frame (a copy, safe to keep)."""
+        frame = self._with_frame(lambda view: view.copy())
+        if frame is not None:
+            with self.frame_lock:
+                self.frame = frame
+        return frame
+
     def get_frame(self):
-        """Get most recent frame."""
+        """Get the frame from the last capture_frame() call."""
         with self.frame_lock:
             return self.frame
 
+    def _detect_buffers(self, frame):
+        """
+        Get the reused detection buffers for frames shaped like frame.
+
+        Returns:
+            (small, gray, blurred, edges) numpy arrays
+        """
+        shape = frame.shape
+        if shape != self._detect_shape:
+            import numpy as np
+            h = shape[0] // DETECT_DOWNSCALE
+            w = shape[1] // DETECT_DOWNSCALE
+            self._detect_bufs = (
+                np.empty((h, w) + shape[2:], frame.dtype),
+                np.empty((h, w), np.uint8),
+                np.empty((h, w), np.uint8),
+                np.empty((h, w), np.uint8),
+            )
+            self._detect_shape = shape
+        return self._detect_bufs
+
     def detect_obstacles(self, frame=None):
         """
         Simple obstacle detection using color/edge detection.
 
+        Work buffers are reused between calls, so only one thread should
+        run detection at a time.
+
+        Args:
+            frame: Frame to check; by default the next camera frame,
+                   processed in place in the camera buffer
+
         Returns:
             list of (x, y, w, h) bounding boxes
         """
         if frame is None:
-            frame = self.get_frame()
-        if frame is None:
-            return []
+            return self._with_frame(self.detect_obstacles) or []
 
         try:
             import cv2
             import numpy as np
 
-            # Convert to grayscale
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-
-            # Apply Gaussian blur
-            blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-
-            # Edge detection
-            edges = cv2.Canny(blurred, 50, 150)
-
-            # Find contours
-            contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL,
-                                           cv2.CHAIN_APPROX_SIMPLE)
-
-            # Filter and return bounding boxes
-            obstacles = []
-            min_area = 500  # Minimum contour area
-            for contour in contours:
-                if cv2.contourArea(contour) > min_area:
-                    x, y, w, h = cv2.boundingRect(contour)
-                    obstacles.append((x, y, w, h))
-
-            return obstacles
+            # Downsample first - every later pass touches 1/scale^2 the
+            # pixels. INTER_AREA averages, so it also suppresses noise.
+            scale = DETECT_DOWNSCALE
+            small, gray, blurred, edges = self._detect_buffers(frame)
+            cv2.resize(frame, (small.shape[1], small.shape[0]), dst=small,
+                       interpolation=cv2.INTER_AREA)
+
+            # With an OpenCL device, run the filter chain through OpenCV's
+            # T-API so the intermediates stay on the device. Otherwise the
+            # CPU (NEON) kernels write into the reused buffers.
+            if cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL():
+                umat = cv2.cvtColor(cv2.UMat(small), cv2.COLOR_BGR2GRAY)
+                umat = cv2.GaussianBlur(umat, (5, 5), 0)
+                edges = cv2.Canny(umat, 50, 150).get()
+            else:
+                # Convert to grayscale
+                cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=gray)
+
+                # Apply Gaussian blur
+                cv2.GaussianBlur(gray, (5, 5), 0, dst=blurred)
+
+                # Edge detection
+                cv2.Canny(blurred, 50, 150, edges=edges)
+
+            # Label connected edge regions; stats rows are
+            # (left, top, width, height, area), row 0 is the background
+            _, _, stats, _ = cv2.connectedComponentsWithStats(
+                edges, connectivity=8)
+            boxes = stats[1:, :4]
+            w = boxes[:, 2]
+            h = boxes[:, 3]
+            pixels = stats[1:, cv2.CC_STAT_AREA]
+
+            # Keep regions whose box is large enough and whose edge wraps
+            # around it: an outline has about 2 * (w + h) pixels, while an
+            # open line, curve or corner has at most about w + h. This
+            # drops open edges (floor seams, wall boundaries) the way the
+            # enclosed-area test on external contours did.
+            min_area = 500 / (scale * scale)  # Minimum region area
+            area = (w - 1) * (h - 1)  # Box through the edge pixel centres
+            keep = (area > min_area) & (pixels > w + h)
+            boxes = boxes[keep]
+            area = area[keep]
+
+            # Drop boxes lying inside a larger one, as the outer-contours
+            # -only search did for nested outlines
+            x0 = boxes[:, 0]
+            y0 = boxes[:, 1]
+            x1 = x0 + boxes[:, 2]
+            y1 = y0 + boxes[:, 3]
+            nested = ((x0[:, None] >= x0) & (y0[:, None] >= y0) &
+                      (x1[:, None] <= x1) & (y1[:, None] <= y1) &
+                      (area[:, None] < area)).any(axis=1)
+
+            # Return bounding boxes in full-frame pixels
+            return list(map(tuple, (boxes[~nested] * scale).tolist()))
 
         except Exception as e:
             print(f"Detection error: {e}")
@@ -368,9 +861,19 @@ class WebController:
 </html>
 '''
 
+        # The page is static - render it once, serve the bytes
+        with app.app_context():
+            index_body = render_template_string(HTML_TEMPLATE).encode()
+
+        try:
+            from orjson import dumps as json_dumps
+        except ImportError:
+            def json_dumps(obj):
+                return json.dumps(obj).encode()
+
         @app.route('/')
         def index():
-            return render_template_string(HTML_TEMPLATE)
+            return Response(index_body, mimetype='text/html')
 
         @app.route('/cmd/<command>')
         def command(command):
@@ -403,26 +906,27 @@ class WebController:
         @app.route('/status')
         def status():
             self.pico.update_sensors()
-            time.sleep(0.1)  # Wait for responses
-            return jsonify({
+            return Response(json_dumps({
                 'imu': self.pico.last_imu,
                 'dist': self.pico.last_dist,
                 'bat': self.pico.last_bat,
-            })
+            }), mimetype='application/json')
 
         @app.route('/video_feed')
         def video_feed():
             def generate():
-                import cv2
+                # Frames are captured, encoded and framed once by the
+                # camera's producer; each client just sends new ones
+                last_seq = -1
                 while True:
-                    if self.camera:
-                        frame = self.camera.capture_frame()
-                        if frame is not None:
-                            _, jpeg = cv2.imencode('.jpg', frame)
-                            yield (b'--frame\r\n'
-                                   b'Content-Type: image/jpeg\r\n\r\n' +
-                                   jpeg.tobytes() + b'\r\n')
-                    time.sleep(0.1)
+                    if not self.camera:
+                        time.sleep(1.0)
+                        continue
+                    # Wakes as soon as the next frame is published
+                    latest = self.camera.wait_mjpeg_part(last_seq)
+                    if latest is not None and latest[0] != last_seq:
+                        last_seq, part = latest
+                        yield part
 
             return Response(generate(),
                           mimetype='multipart/x-mixed-replace; boundary=frame')
@@ -435,6 +939,8 @@ class WebController:
         if not self.app:
             self.create_app()
         print(f"Starting web server on http://{host}:{self.port}")
+        # Request threads are started from here and inherit the placement
+        _pin_thread(WEB_CPUS)
         self.app.run(host=host, port=self.port, threaded=True)
 
 
@@ -449,8 +955,9 @@ def main():
         print("Failed to connect to Pico. Exiting.")
         return
 
-    # Initialize camera
+    # Initialize camera (its threads inherit the main thread's CPU)
     camera = CameraProcessor()
+    _pin_thread(CAMERA_CPUS)
     camera.start()
 
     # Start web controller